@@ -44,6 +44,7 @@ class Settings(BaseSettings):
     llm_model: str = "llama3.2"
     llm_base_url: str = "http://localhost:11434/v1"
     llm_api_key: str = ""
+    llm_rpm: int = 0  # requests per minute per provider, 0 = unlimited
 
     # Projects and agents directories
     agents_dir: str = "./agents"
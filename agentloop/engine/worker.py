@@ -7,10 +7,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import Session, select, update
 
 from ..config import settings
-from ..models import Agent, Event, Mission, Project, ProjectContext, Step, StepStatus
+from ..models import (
+    Agent, Event, Mission, Project, ProjectContext, Step, StepStatus, StepType,
+)
 from ..protocols import ChatDispatcher, StepDispatcher
 
 logger = logging.getLogger(__name__)
@@ -23,6 +25,39 @@ class WorkerEngine:
     _chat_dispatcher: Optional[ChatDispatcher] = None
     _plugin_manager = None
 
+    # Capability an agent needs to take each step type; "general_work" covers all
+    _STEP_CAPABILITIES: Dict[StepType, str] = {
+        StepType.CODE: "write_code",
+        StepType.TEST: "run_tests",
+        StepType.REVIEW: "review_code",
+        StepType.DEPLOY: "deploy_code",
+        StepType.RESEARCH: "research",
+        StepType.SECURITY: "security_audit",
+        StepType.OTHER: "general_work",
+    }
+
+    # Reverse lookup, built once: capability → the step type it unlocks
+    _CAPABILITY_TO_TYPE: Dict[str, StepType] = {
+        capability: step_type for step_type, capability in _STEP_CAPABILITIES.items()
+    }
+
+    # Most recent ProjectContext entries included in a work prompt
+    _PROMPT_CONTEXT_LIMIT = 20
+
+    # Work prompt used when the agent config doesn't define "work_prompt"
+    _DEFAULT_WORK_PROMPT = (
+        "You are {agent_name} working on {project_name}.\n\n"
+        "Current task: {step_title}\n"
+        "Description: {step_description}\n"
+        "Step type: {step_type}\n\n"
+        "Mission: {mission_title}\n"
+        "{mission_description}\n\n"
+        "Project: {project_description}\n"
+        "Repository: {repo_path}\n\n"
+        "{project_knowledge}\n\n"
+        "Please complete this task and report your results."
+    )
+
     def __init__(self):
         self.agents_dir = Path(settings.agents_dir)
         self.projects_dir = Path(settings.projects_dir)
@@ -45,11 +80,13 @@ class WorkerEngine:
     def find_and_execute_work(self, agent: Agent, session: Session) -> bool:
         """Find and execute available work for an agent."""
         try:
-            available_steps = self._find_available_steps(agent, session)
-            if not available_steps:
+            # Take the first candidate nobody else has grabbed since the poll
+            for step in self._find_available_steps(agent, session):
+                if self._claim_step(step, agent, session):
+                    break
+            else:
                 return False
 
-            step = available_steps[0]
             agent_config = self._load_agent_config(agent)
             project_config = self._load_project_config(agent.project_id, session)
             return self._execute_step(step, agent, agent_config, project_config, session)
@@ -57,8 +94,42 @@ class WorkerEngine:
             logger.exception("find_and_execute_work failed for agent %s", agent.name)
             return False
 
+    def _claim_step(self, step: Step, agent: Agent, session: Session) -> bool:
+        """Atomically claim and start ``step`` for ``agent``.
+
+        The UPDATE only matches while the step is still unclaimed (or already
+        ours) and not yet running, so concurrent workers can't both take it.
+        """
+        result = session.execute(
+            update(Step)
+            .where(Step.id == step.id)
+            .where(
+                (Step.claimed_by_agent_id.is_(None))
+                | (Step.claimed_by_agent_id == agent.id)
+            )
+            .where(Step.status.in_([StepStatus.PENDING, StepStatus.CLAIMED]))
+            .values(
+                claimed_by_agent_id=agent.id,
+                status=StepStatus.RUNNING,
+                started_at=datetime.utcnow(),
+            )
+        )
+        session.commit()
+        # The ORM syncs the UPDATE onto ``step`` by evaluating the WHERE against
+        # the in-memory row, not the DB. If another worker won the race, our
+        # stale copy still matches, so it now holds *our* claim even though no
+        # row changed, and without expire_on_commit that survives the commit.
+        # Expire it so the next access reloads the real claim from the DB.
+        session.expire(step)
+        return result.rowcount == 1
+
     def _find_available_steps(self, agent: Agent, session: Session) -> List[Step]:
         """Find steps that this agent can work on."""
+        step_types = self._allowed_step_types(agent)
+        if step_types is not None and not step_types:
+            # No capability matches any step type; don't ask the DB
+            return []
+
         query = (
             select(Step)
             .join(Step.mission)
@@ -67,31 +138,28 @@ class WorkerEngine:
                 | (Step.claimed_by_agent_id == agent.id)
             )
             .where(Step.status.in_([StepStatus.PENDING, StepStatus.CLAIMED]))
-            .where(Step.mission.has(project_id=agent.project_id))
+            .where(Mission.project_id == agent.project_id)
             .order_by(Step.order_index.asc(), Step.created_at.asc())
         )
-        steps = session.exec(query).all()
-        return [s for s in steps if self._can_agent_handle_step(agent, s)]
+        # None means the agent takes any type, so the predicate is omitted
+        if step_types is not None:
+            query = query.where(Step.step_type.in_(step_types))
+        return list(session.exec(query).all())
 
-    def _can_agent_handle_step(self, agent: Agent, step: Step) -> bool:
-        """Check if an agent can handle a specific step type."""
+    def _allowed_step_types(self, agent: Agent) -> Optional[List[StepType]]:
+        """Step types the agent has capabilities for, or None if it takes any."""
         try:
-            agent_config = self._load_agent_config(agent)
-            capabilities = agent_config.get("capabilities", [])
-            step_capability_map = {
-                "code": "write_code",
-                "test": "run_tests",
-                "review": "review_code",
-                "deploy": "deploy_code",
-                "research": "research",
-                "security": "security_audit",
-                "other": "general_work",
-            }
-            required = step_capability_map.get(step.step_type.value, "general_work")
-            return required in capabilities or "general_work" in capabilities
+            capabilities = self._load_agent_config(agent).get("capabilities", [])
+            if "general_work" in capabilities:
+                return None
+            return [
+                self._CAPABILITY_TO_TYPE[capability]
+                for capability in capabilities
+                if capability in self._CAPABILITY_TO_TYPE
+            ]
         except Exception:
-            logger.debug("Could not check capabilities for agent %s, allowing step", agent.name)
-            return True
+            logger.debug("Could not check capabilities for agent %s, allowing all steps", agent.name)
+            return None
 
     def _load_agent_config(self, agent: Agent) -> Dict[str, Any]:
         """Load agent configuration from YAML file or database."""
@@ -132,19 +200,8 @@ class WorkerEngine:
         project_config: Dict[str, Any],
         session: Session,
     ) -> bool:
-        """Execute a step — dispatch to OpenClaw gateway."""
+        """Execute a claimed, running step — dispatch to OpenClaw gateway."""
         try:
-            # Claim the step if not already claimed
-            if step.claimed_by_agent_id != agent.id:
-                step.claimed_by_agent_id = agent.id
-                step.status = StepStatus.CLAIMED
-                session.commit()
-
-            # Start the step
-            step.status = StepStatus.RUNNING
-            step.started_at = datetime.utcnow()
-            session.commit()
-
             # Generate the work prompt
             work_prompt = self._generate_work_prompt(
                 step, agent, agent_config, project_config, session
@@ -265,7 +322,8 @@ class WorkerEngine:
                 select(ProjectContext)
                 .where(ProjectContext.project_id == project.id)
                 .order_by(ProjectContext.created_at.desc())
-            ).all()[:20]
+                .limit(self._PROMPT_CONTEXT_LIMIT)
+            ).all()
             if ctx_entries:
                 lines = ["--- Project Knowledge ---"]
                 for e in ctx_entries:
@@ -303,21 +361,7 @@ class WorkerEngine:
             "system_prompt": agent_config.get("system_prompt", ""),
         }
 
-        work_prompt_template = agent_config.get(
-            "work_prompt",
-            (
-                "You are {agent_name} working on {project_name}.\n\n"
-                "Current task: {step_title}\n"
-                "Description: {step_description}\n"
-                "Step type: {step_type}\n\n"
-                "Mission: {mission_title}\n"
-                "{mission_description}\n\n"
-                "Project: {project_description}\n"
-                "Repository: {repo_path}\n\n"
-                "{project_knowledge}\n\n"
-                "Please complete this task and report your results."
-            ),
-        )
+        work_prompt_template = agent_config.get("work_prompt", self._DEFAULT_WORK_PROMPT)
 
         try:
             return work_prompt_template.format(agent_name=agent.name, **context)
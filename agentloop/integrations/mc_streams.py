@@ -19,6 +19,9 @@ logger = logging.getLogger(__name__)
 # Active stream tasks keyed by board_id
 _active_streams: Dict[str, asyncio.Task] = {}
 
+# Max SSE events buffered per stream before the oldest are dropped
+_EVENT_QUEUE_SIZE = 256
+
 
 def _sse_headers() -> dict:
     headers = {"Accept": "text/event-stream"}
@@ -36,6 +39,58 @@ async def _listen_sse(
 ) -> None:
     """Connect to an SSE endpoint and dispatch parsed events.
 
+    Parsed events go through a bounded queue drained by a separate
+    task that runs the handler in a worker thread, so a slow handler
+    never stalls the reader; if it lags, old events are dropped instead
+    of buffering without limit.
+    """
+    queue: asyncio.Queue[tuple[str, dict]] = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+    consumer = asyncio.create_task(_drain_events(queue, on_event, label))
+    try:
+        await _read_sse(url, queue, label)
+    finally:
+        consumer.cancel()
+
+
+async def _drain_events(
+    queue: "asyncio.Queue[tuple[str, dict]]",
+    on_event: Callable[[str, dict], None],
+    label: str,
+) -> None:
+    """Hand queued SSE events to *on_event* one at a time.
+
+    Handlers may block (e.g. a DB + HTTP sync), so they run in a worker
+    thread and the event loop keeps reading the stream meanwhile.
+    """
+    while True:
+        event_type, payload = await queue.get()
+        try:
+            await asyncio.to_thread(on_event, event_type, payload)
+        except Exception:
+            logger.exception("SSE handler error (%s)", label)
+        finally:
+            queue.task_done()
+
+
+def _enqueue_event(
+    queue: "asyncio.Queue[tuple[str, dict]]", item: tuple[str, dict], label: str
+) -> None:
+    """Queue an event, dropping the oldest one if the consumer is lagging."""
+    try:
+        queue.put_nowait(item)
+    except asyncio.QueueFull:
+        queue.get_nowait()
+        queue.put_nowait(item)
+        logger.warning("SSE %s queue full — dropped oldest event", label)
+
+
+async def _read_sse(
+    url: str,
+    queue: "asyncio.Queue[tuple[str, dict]]",
+    label: str,
+) -> None:
+    """Read an SSE endpoint and queue each parsed event.
+
     Reconnects automatically on error with exponential backoff
     (capped at 60 s).
     """
@@ -67,10 +122,9 @@ async def _listen_sse(
                                     payload = json.loads(raw)
                                 except json.JSONDecodeError:
                                     payload = {"raw": raw}
-                                try:
-                                    on_event(event_type or "message", payload)
-                                except Exception:
-                                    logger.exception("SSE handler error (%s)", label)
+                                _enqueue_event(
+                                    queue, (event_type or "message", payload), label
+                                )
                             event_type = ""
                             data_lines = []
 
@@ -5,9 +5,34 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from ..config import settings
+from ..models import Proposal, ProposalPriority, ProposalStatus
 
 logger = logging.getLogger(__name__)
 
+_LIMITS = httpx.Limits(
+    max_keepalive_connections=32, max_connections=64, keepalive_expiry=60
+)
+
+# Shared clients so MC calls reuse pooled keep-alive connections
+_http = httpx.Client(timeout=10, limits=_LIMITS)
+_async_http: Optional[httpx.AsyncClient] = None
+
+
+def _async_client() -> httpx.AsyncClient:
+    """Return the shared async client, creating it on first use."""
+    global _async_http
+    if _async_http is None or _async_http.is_closed:
+        _async_http = httpx.AsyncClient(timeout=10, limits=_LIMITS)
+    return _async_http
+
+
+async def aclose_http() -> None:
+    """Close the shared async client; it is recreated on next use."""
+    global _async_http
+    if _async_http is not None:
+        await _async_http.aclose()
+        _async_http = None
+
 
 def _headers() -> dict:
     headers = {"Content-Type": "application/json"}
@@ -21,7 +46,20 @@ def _headers() -> dict:
 def mc_get(path: str) -> Optional[dict]:
     """GET from Mission Control API."""
     try:
-        r = httpx.get(f"{settings.mc_base_url}{path}", headers=_headers(), timeout=10)
+        r = _http.get(f"{settings.mc_base_url}{path}", headers=_headers())
+        r.raise_for_status()
+        return r.json()
+    except Exception as e:
+        logger.warning("MC GET %s failed: %s", path, e)
+        return None
+
+
+async def amc_get(path: str) -> Optional[dict]:
+    """GET from Mission Control API without blocking the event loop."""
+    try:
+        r = await _async_client().get(
+            f"{settings.mc_base_url}{path}", headers=_headers()
+        )
         r.raise_for_status()
         return r.json()
     except Exception as e:
@@ -32,8 +70,8 @@ def mc_get(path: str) -> Optional[dict]:
 def mc_post(path: str, data: dict) -> Optional[dict]:
     """POST to Mission Control API."""
     try:
-        r = httpx.post(
-            f"{settings.mc_base_url}{path}", headers=_headers(), json=data, timeout=10
+        r = _http.post(
+            f"{settings.mc_base_url}{path}", headers=_headers(), json=data
         )
         r.raise_for_status()
         return r.json()
@@ -45,8 +83,8 @@ def mc_post(path: str, data: dict) -> Optional[dict]:
 def mc_patch(path: str, data: dict) -> Optional[dict]:
     """PATCH Mission Control API."""
     try:
-        r = httpx.patch(
-            f"{settings.mc_base_url}{path}", headers=_headers(), json=data, timeout=10
+        r = _http.patch(
+            f"{settings.mc_base_url}{path}", headers=_headers(), json=data
         )
         r.raise_for_status()
         return r.json()
@@ -63,12 +101,28 @@ def get_boards() -> List[dict]:
     return data.get("items", []) if data else []
 
 
-def get_board_tasks(board_id: str, status: str = None) -> List[dict]:
-    """Get tasks for a board, optionally filtered by status."""
+def _board_tasks_path(board_id: str, status: Optional[str]) -> str:
     path = f"/api/v1/boards/{board_id}/tasks"
     if status:
         path += f"?status={status}"
-    data = mc_get(path)
+    return path
+
+
+def get_board_tasks(board_id: str, status: str = None) -> List[dict]:
+    """Get tasks for a board, optionally filtered by status."""
+    data = mc_get(_board_tasks_path(board_id, status))
+    return data.get("items", []) if data else []
+
+
+async def aget_boards() -> List[dict]:
+    """Async variant of :func:`get_boards`."""
+    data = await amc_get("/api/v1/boards")
+    return data.get("items", []) if data else []
+
+
+async def aget_board_tasks(board_id: str, status: str = None) -> List[dict]:
+    """Async variant of :func:`get_board_tasks`."""
+    data = await amc_get(_board_tasks_path(board_id, status))
     return data.get("items", []) if data else []
 
 
@@ -125,6 +179,40 @@ def sync_tasks_for_project(board_id: str) -> List[dict]:
     return [t for t in tasks if t.get("status") in ("inbox", "in_progress")]
 
 
+# MC task priority → proposal priority
+_PRIORITY_MAP: Dict[str, ProposalPriority] = {
+    "critical": ProposalPriority.CRITICAL,
+    "high": ProposalPriority.HIGH,
+    "medium": ProposalPriority.MEDIUM,
+    "low": ProposalPriority.LOW,
+}
+
+# Priorities whose synced proposals skip human review
+_AUTO_APPROVE = frozenset({ProposalPriority.CRITICAL, ProposalPriority.HIGH})
+
+
+def build_proposal(
+    task: dict, *, agent_id: Any, project_id: Any, board_id: str
+) -> Proposal:
+    """Build a pending proposal for an inbound MC task."""
+    mc_task_id = task["id"]
+    priority = _PRIORITY_MAP.get(
+        task.get("priority", "medium").lower(), ProposalPriority.MEDIUM
+    )
+    return Proposal(
+        agent_id=agent_id,
+        project_id=project_id,
+        title=task.get("title", "Untitled MC Task"),
+        description=task.get("description", ""),
+        rationale=f"Synced from Mission Control task {mc_task_id}",
+        priority=priority,
+        status=ProposalStatus.PENDING,
+        auto_approve=priority in _AUTO_APPROVE,
+        mc_task_id=mc_task_id,
+        mc_board_id=board_id,
+    )
+
+
 def mark_task_in_progress(board_id: str, task_id: str) -> bool:
     """Mark a MC task as in_progress when an agent claims it."""
     result = update_task_status(board_id, task_id, "in_progress")
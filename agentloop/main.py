@@ -6,7 +6,7 @@ import time
 from typing import Dict
 from uuid import UUID
 
-from fastapi import Depends, FastAPI, HTTPException
+from fastapi import Depends, FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlmodel import Session
 
@@ -247,7 +247,10 @@ async def list_plugins():
 @app.get("/api/v1/plugins/tabs")
 async def plugin_tabs():
     """Return frontend tab metadata from all plugins."""
-    return plugin_manager.get_frontend_tabs()
+    return Response(
+        content=plugin_manager.get_frontend_tabs_json(),
+        media_type="application/json",
+    )
 
 
 # Admin/debug endpoints (only in debug mode)
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from uuid_extensions import uuid7
-from sqlmodel import Column, Field, JSON, Relationship, SQLModel
+from sqlmodel import Column, Field, Index, JSON, Relationship, SQLModel
 
 
 class ProjectStatus(str, Enum):
@@ -175,12 +175,24 @@ class Mission(BaseModel, table=True):
 
 class Step(BaseModel, table=True):
     """Step table."""
+    __table_args__ = (
+        # Covers the worker poll (status, claim, mission, capability); status
+        # leads so it also serves plain status lookups
+        Index(
+            "ix_step_worker_poll",
+            "status",
+            "claimed_by_agent_id",
+            "mission_id",
+            "step_type",
+        ),
+    )
+
     mission_id: UUID = Field(foreign_key="mission.id", index=True)
     order_index: int = Field(index=True)
     title: str = Field(index=True)
     description: str
     step_type: StepType = Field(index=True)
-    status: StepStatus = Field(default=StepStatus.PENDING, index=True)
+    status: StepStatus = Field(default=StepStatus.PENDING)
     claimed_by_agent_id: Optional[UUID] = Field(foreign_key="agent.id", index=True)
     output: Optional[str] = None
     error: Optional[str] = None
@@ -6,11 +6,13 @@ Python modules that provide routes, hooks, and optional SQLModel models.
 """
 
 import importlib
+import itertools
+import json
 import logging
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import yaml
 from fastapi import APIRouter, FastAPI
@@ -18,6 +20,9 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Shared result for hooks with no registered handlers
+_EMPTY_RESULTS: Sequence[Any] = ()
+
 
 # ── Manifest schema ──────────────────────────────────────────────
 
@@ -73,6 +78,11 @@ class PluginManager:
             else None
         )
         self.plugins: Dict[str, LoadedPlugin] = {}
+        # hook name → [(plugin name, handler)], rebuilt by load_all()
+        self._hooks_by_name: Dict[str, List[Tuple[str, Callable]]] = {}
+        # Frontend tab metadata, rebuilt by load_all()
+        self._frontend_tabs: List[Dict[str, Any]] = []
+        self._frontend_tabs_bytes: bytes = b"[]"
 
     # ── Discovery ────────────────────────────────────────────
 
@@ -116,6 +126,37 @@ class PluginManager:
             except Exception:
                 logger.exception("Failed to load plugin: %s", manifest.name)
 
+        self._index_hooks()
+        self._index_frontend_tabs()
+
+    def _index_hooks(self) -> None:
+        """Flatten per-plugin hook callables into a lookup keyed by hook name."""
+        hooks_by_name: Dict[str, List[Tuple[str, Callable]]] = {}
+        for plugin_name, plugin in self.plugins.items():
+            for hook_name, fns in plugin.hook_callables.items():
+                hooks_by_name.setdefault(hook_name, []).extend(
+                    (plugin_name, fn) for fn in fns
+                )
+        self._hooks_by_name = hooks_by_name
+
+    def _index_frontend_tabs(self) -> None:
+        """Collect tab metadata and pre-encode it as a JSON response body."""
+        tabs: List[Dict[str, Any]] = []
+        for name, plugin in self.plugins.items():
+            for tab in plugin.manifest.frontend_tabs:
+                tabs.append({
+                    "plugin": name,
+                    "id": tab.id,
+                    "label": tab.label,
+                    "icon": tab.icon,
+                    "component_path": tab.component_path,
+                })
+        self._frontend_tabs = tabs
+        # Same encoding as FastAPI's JSONResponse, so the body is byte-identical
+        self._frontend_tabs_bytes = json.dumps(
+            tabs, ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+
     def _load_plugin(self, manifest: PluginManifest) -> LoadedPlugin:
         """Import a single plugin's modules and resolve references."""
         plugin_dir = self.plugins_dir / manifest.name
@@ -210,23 +251,21 @@ class PluginManager:
 
         parts = dotted_ref.split(".")
         # Resolve the file path
-        candidate = plugin_dir / "/".join(parts)
+        candidate = plugin_dir.joinpath(*parts)
         if candidate.is_dir():
             file_path = candidate / "__init__.py"
         else:
-            file_path = plugin_dir / "/".join(parts[:-1] + [parts[-1] + ".py"])
+            file_path = candidate.with_suffix(".py")
             if not file_path.exists():
                 file_path = candidate / "__init__.py"
 
         # Ensure intermediate packages exist in sys.modules
+        pkg_root = f"_agentloop_plugins.{fqn.split('.')[1]}"
+        prefixes = list(itertools.accumulate(parts, lambda a, b: f"{a}.{b}"))
         for i in range(1, len(parts)):
-            intermediate = ".".join(fqn.split(".")[:-(len(parts) - i)])
-            sub_parts = parts[:i]
-            inter_fqn = f"{intermediate}.{'.'.join(sub_parts)}" if intermediate else fqn.rsplit(".", len(parts) - i)[0]
-            # Simpler: build from the namespace root
-            inter_fqn = f"_agentloop_plugins.{fqn.split('.')[1]}.{'.'.join(sub_parts)}"
+            inter_fqn = f"{pkg_root}.{prefixes[i - 1]}"
             if inter_fqn not in sys.modules:
-                inter_dir = plugin_dir / "/".join(sub_parts)
+                inter_dir = plugin_dir.joinpath(*parts[:i])
                 pkg = types.ModuleType(inter_fqn)
                 pkg.__path__ = [str(inter_dir)]
                 pkg.__package__ = inter_fqn
@@ -251,39 +290,36 @@ class PluginManager:
 
     # ── Hooks ────────────────────────────────────────────────
 
-    def dispatch_hook(self, name: str, **kwargs: Any) -> List[Any]:
+    def dispatch_hook(self, name: str, **kwargs: Any) -> Sequence[Any]:
         """Call all registered hooks for *name*, passing **kwargs.
 
-        Returns a list of return values (one per handler).
+        Returns a sequence of return values (one per handler).
         Exceptions in individual handlers are logged but do not
         prevent subsequent handlers from running.
         """
+        handlers = self._hooks_by_name.get(name)
+        if not handlers:
+            return _EMPTY_RESULTS
+
         results: List[Any] = []
-        for plugin_name, plugin in self.plugins.items():
-            for fn in plugin.hook_callables.get(name, []):
-                try:
-                    results.append(fn(**kwargs))
-                except Exception:
-                    logger.exception(
-                        "Hook %s from plugin %s failed", name, plugin_name
-                    )
+        for plugin_name, fn in handlers:
+            try:
+                results.append(fn(**kwargs))
+            except Exception:
+                logger.exception(
+                    "Hook %s from plugin %s failed", name, plugin_name
+                )
         return results
 
     # ── Query helpers ────────────────────────────────────────
 
     def get_frontend_tabs(self) -> List[Dict[str, Any]]:
         """Return tab metadata from all loaded plugins."""
-        tabs: List[Dict[str, Any]] = []
-        for name, plugin in self.plugins.items():
-            for tab in plugin.manifest.frontend_tabs:
-                tabs.append({
-                    "plugin": name,
-                    "id": tab.id,
-                    "label": tab.label,
-                    "icon": tab.icon,
-                    "component_path": tab.component_path,
-                })
-        return tabs
+        return list(self._frontend_tabs)
+
+    def get_frontend_tabs_json(self) -> bytes:
+        """Return tab metadata pre-encoded as a JSON array."""
+        return self._frontend_tabs_bytes
 
     def has_plugin(self, name: str) -> bool:
         """Check if a plugin is loaded by name."""
@@ -0,0 +1,37 @@
+"""add step worker poll index
+
+Replaces the single-column status index with a composite index that covers
+the worker's available-steps query. status stays the leading column, so
+plain status lookups still use it.
+
+Revision ID: 6186eb69fa2c
+Revises: d020083e2ec6
+Create Date: 2026-10-16 10:12:44.318502
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6186eb69fa2c'
+down_revision: Union[str, Sequence[str], None] = 'd020083e2ec6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('step', schema=None) as batch_op:
+        batch_op.create_index('ix_step_worker_poll', ['status', 'claimed_by_agent_id', 'mission_id', 'step_type'], unique=False)
+        batch_op.drop_index(batch_op.f('ix_step_status'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('step', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_step_status'), ['status'], unique=False)
+        batch_op.drop_index('ix_step_worker_poll')
@@ -8,6 +8,8 @@ OpenAI, OpenRouter, and any compatible endpoint.
 import logging
 from typing import Any, Dict, Optional
 
+from .provider import for_config, get_provider
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,8 +18,6 @@ class LLMStepDispatcher:
 
     def dispatch(self, step_id: str, work_prompt: str, timeout: int,
                  agent_config: Optional[Dict[str, Any]] = None) -> dict:
-        from .provider import for_config, get_provider
-
         if agent_config:
             provider = for_config(agent_config)
             system = agent_config.get("system_prompt")
@@ -37,8 +37,6 @@ class LLMChatDispatcher:
     """ChatDispatcher implementation backed by a generic LLM."""
 
     def send(self, session_id: str, message: str, timeout: int) -> dict:
-        from .provider import get_provider
-
         provider = get_provider()
         try:
             text = provider.chat(prompt=message)
@@ -49,8 +47,6 @@ class LLMChatDispatcher:
 
     def stream_send(self, session_id: str, message: str, provider=None):
         """Yield text chunks via streaming chat completion."""
-        from .provider import get_provider
-
         llm = provider or get_provider()
         yield from llm.chat_stream(prompt=message)
 
@@ -59,7 +55,6 @@ class LLMChatDispatcher:
 
     @property
     def available(self) -> bool:
-        from .provider import get_provider
         try:
             return get_provider().available
         except Exception:
@@ -72,6 +67,7 @@ def on_startup(**kwargs):
 
     WorkerEngine.set_dispatcher(LLMStepDispatcher())
     WorkerEngine.set_chat_dispatcher(LLMChatDispatcher())
+    get_provider().warmup()
     logger.info("llm plugin: registered step + chat dispatchers")
 
 
@@ -5,8 +5,12 @@ OpenAI-compatible endpoint (OpenAI, OpenRouter, Together, etc.).
 """
 
 import logging
-from typing import Any, Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, Optional
 
+import httpx
 from openai import OpenAI
 
 from agentloop.config import settings
@@ -20,6 +24,35 @@ _PROVIDER_DEFAULTS: dict[str, str] = {
     "openrouter": "https://openrouter.ai/api/v1",
 }
 
+# Matches the OpenAI SDK's default, so long generations aren't cut off
+_HTTP_TIMEOUT = httpx.Timeout(600, connect=5)
+
+
+class _TokenBucket:
+    """Blocking token-bucket rate limiter shared by a provider's threads."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 class LLMProvider:
     """Stateless LLM client using the OpenAI SDK."""
@@ -46,12 +79,38 @@ class LLMProvider:
         # API key: Ollama doesn't need one, but the SDK requires a non-empty string
         key = api_key or settings.llm_api_key or "ollama"
 
-        self._client = OpenAI(base_url=self.base_url, api_key=key)
+        # Pre-emptive throttle so bursts queue locally instead of hitting 429s
+        rpm = settings.llm_rpm
+        self._bucket = _TokenBucket(rate=rpm / 60, capacity=rpm) if rpm > 0 else None
+
+        # Pooled transport so repeat calls skip TCP/TLS setup
+        self._http = httpx.Client(
+            limits=httpx.Limits(
+                max_keepalive_connections=32, max_connections=64, keepalive_expiry=60
+            ),
+            timeout=_HTTP_TIMEOUT,
+        )
+        self._client = OpenAI(
+            base_url=self.base_url, api_key=key, http_client=self._http
+        )
         logger.info(
             "LLM provider ready: provider=%s model=%s base_url=%s",
             provider, self.model, self.base_url,
         )
 
+    def warmup(self) -> None:
+        """Open the pooled connection in the background, off the request path."""
+        threading.Thread(target=self._warmup, daemon=True).start()
+
+    def _warmup(self) -> None:
+        """Issue a cheap request so the first chat reuses a live connection."""
+        if self._bucket:
+            self._bucket.acquire()
+        try:
+            self._client.models.list()
+        except Exception:
+            logger.debug("LLM warmup request to %s failed", self.base_url)
+
     @property
     def available(self) -> bool:
         """Quick health check — try a tiny request."""
@@ -61,6 +120,15 @@ class LLMProvider:
         except Exception:
             return False
 
+    @staticmethod
+    def _messages(prompt: str, system: Optional[str]) -> list[dict[str, str]]:
+        """Build the chat message list for a single-turn prompt."""
+        messages: list[dict[str, str]] = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
     def chat(
         self,
         prompt: str,
@@ -69,36 +137,57 @@ class LLMProvider:
         max_tokens: int = 4096,
     ) -> str:
         """Send a chat completion and return the assistant text."""
-        messages: list[dict[str, str]] = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
-
+        if self._bucket:
+            self._bucket.acquire()
+        # Non-streaming on purpose: not every compatible backend supports stream=True
         response = self._client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            messages=self._messages(prompt, system),
             temperature=temperature,
             max_tokens=max_tokens,
         )
 
         return response.choices[0].message.content or ""
 
+    def chat_many(
+        self,
+        prompts: list[str],
+        system: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        concurrency: int = 10,
+    ) -> list[str]:
+        """Run several independent prompts concurrently.
+
+        Results are returned in the same order as *prompts*. At most
+        *concurrency* requests are in flight at once, all sharing the
+        provider's pooled connections.
+        """
+        if not prompts:
+            return []
+
+        def _one(prompt: str) -> str:
+            return self.chat(
+                prompt, system=system, temperature=temperature, max_tokens=max_tokens
+            )
+
+        workers = max(1, min(len(prompts), concurrency))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            return list(ex.map(_one, prompts))
+
     def chat_stream(
         self,
         prompt: str,
         system: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
-    ):
+    ) -> Iterator[str]:
         """Yield text chunks from a streaming chat completion."""
-        messages: list[dict[str, str]] = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
-
+        if self._bucket:
+            self._bucket.acquire()
         response = self._client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            messages=self._messages(prompt, system),
             temperature=temperature,
             max_tokens=max_tokens,
             stream=True,
@@ -116,12 +205,17 @@ _instance: Optional[LLMProvider] = None
 # Cache for per-agent providers keyed by (provider, model, base_url)
 _config_cache: dict[tuple[str, str, str], LLMProvider] = {}
 
+# Guards creation of _instance and _config_cache entries
+_lock = threading.Lock()
+
 
 def get_provider() -> LLMProvider:
     """Return (and lazily create) the singleton LLMProvider."""
     global _instance
     if _instance is None:
-        _instance = LLMProvider()
+        with _lock:
+            if _instance is None:
+                _instance = LLMProvider()
     return _instance
 
 
@@ -148,11 +242,13 @@ def for_config(config: Dict[str, Any]) -> LLMProvider:
     )
 
     if cache_key not in _config_cache:
-        _config_cache[cache_key] = LLMProvider(
-            provider=provider or None,
-            model=model or None,
-            base_url=base_url or None,
-            api_key=api_key or None,
-        )
+        with _lock:
+            if cache_key not in _config_cache:
+                _config_cache[cache_key] = LLMProvider(
+                    provider=provider or None,
+                    model=model or None,
+                    base_url=base_url or None,
+                    api_key=api_key or None,
+                )
 
     return _config_cache[cache_key]
@@ -6,28 +6,89 @@ All MC-specific logic that was previously hardcoded in the core.
 
 import asyncio
 import logging
-
-from sqlmodel import select
+import threading
+import time
+
+from sqlmodel import Session, case, func, select
+
+from agentloop.database import engine as db_engine
+from agentloop.integrations.mc_streams import (
+    set_sync_callback, start_all_board_streams, stop_all_streams,
+)
+from agentloop.integrations.mission_control import (
+    BOARD_PROJECT_MAP, aclose_http, ask_user, build_proposal,
+    report_agent_activity, sync_tasks_for_project, update_task_status,
+)
+from agentloop.models import (
+    Agent, AgentStatus, Event, Mission, MissionStatus, Project, ProjectStatus,
+    Proposal, Step, StepStatus,
+)
 
 logger = logging.getLogger(__name__)
 
+# Minimum seconds between SSE-triggered syncs of the same board
+_SYNC_DEBOUNCE_SECONDS = 2.0
+
+# board_id → time.monotonic() of the last SSE-triggered sync
+_last_sync: dict[str, float] = {}
+
+# board_id → timer for the trailing sync at the end of its debounce window
+_pending_sync: dict[str, threading.Timer] = {}
+
+# Guards _pending_sync; SSE handlers for different boards run in parallel threads
+_pending_lock = threading.Lock()
+
+# Step states that mean a mission can still make progress on its own
+_IN_FLIGHT_STEP_STATUSES = (StepStatus.PENDING, StepStatus.CLAIMED, StepStatus.RUNNING)
+
+
+def _run_board_sync(board_id: str) -> None:
+    """Run an inbound sync on a fresh session, logging any failure."""
+    _last_sync[board_id] = time.monotonic()
+    try:
+        with Session(db_engine) as session:
+            on_tick_sync(session=session)
+    except Exception:
+        logger.warning("SSE-triggered sync failed for board %s", board_id)
+
+
+def _run_trailing_sync(board_id: str) -> None:
+    """Fire the sync deferred until the end of a debounce window."""
+    with _pending_lock:
+        _pending_sync.pop(board_id, None)
+    _run_board_sync(board_id)
+
+
+def _sync_board(board_id: str) -> None:
+    """Trigger inbound sync when SSE detects a new task.
+
+    Called from a worker thread, since SSE handlers run off the event loop.
+    Bursts are coalesced per board: the first event syncs immediately, and
+    any events inside the following debounce window collapse into a single
+    trailing sync when it closes, so a task created mid-burst isn't left
+    waiting for the next poll tick.
+    """
+    now = time.monotonic()
+    last = _last_sync.get(board_id)
+    if last is None or now - last >= _SYNC_DEBOUNCE_SECONDS:
+        _run_board_sync(board_id)
+        return
+
+    with _pending_lock:
+        if board_id in _pending_sync:
+            return
+        timer = threading.Timer(
+            last + _SYNC_DEBOUNCE_SECONDS - now, _run_trailing_sync, args=(board_id,)
+        )
+        timer.daemon = True
+        _pending_sync[board_id] = timer
+    timer.start()
+
 
 def on_startup(**kwargs):
     """Start SSE streams for MC boards."""
-    from agentloop.integrations.mc_streams import set_sync_callback, start_all_board_streams
-
     app = kwargs.get("app")
 
-    def _sync_board(board_id: str) -> None:
-        """Trigger inbound sync when SSE detects a new task."""
-        from agentloop.database import engine as db_engine
-        from sqlmodel import Session
-        try:
-            with Session(db_engine) as session:
-                on_tick_sync(session=session)
-        except Exception:
-            logger.warning("SSE-triggered sync failed for board %s", board_id)
-
     set_sync_callback(_sync_board)
 
     try:
@@ -43,11 +104,15 @@ def on_startup(**kwargs):
 
 def on_shutdown(**kwargs):
     """Stop SSE streams."""
-    from agentloop.integrations.mc_streams import stop_all_streams
+    with _pending_lock:
+        for timer in _pending_sync.values():
+            timer.cancel()
+        _pending_sync.clear()
 
     try:
         loop = asyncio.get_running_loop()
         loop.create_task(stop_all_streams())
+        loop.create_task(aclose_http())
     except RuntimeError:
         pass
 
@@ -63,68 +128,60 @@ def on_tick_sync(**kwargs):
     if session is None:
         return
 
-    from agentloop.integrations.mission_control import (
-        BOARD_PROJECT_MAP, sync_tasks_for_project,
-    )
-    from agentloop.models import (
-        Agent, AgentStatus, Project, ProjectStatus, Proposal,
-        ProposalPriority, ProposalStatus,
-    )
-
     if not BOARD_PROJECT_MAP:
         return
 
+    try:
+        projects = {
+            p.slug: p
+            for p in session.exec(
+                select(Project).where(
+                    Project.slug.in_(set(BOARD_PROJECT_MAP.values()))
+                )
+            )
+        }
+        agent_by_project = {}
+        for agent in session.exec(
+            select(Agent)
+            .where(Agent.project_id.in_([p.id for p in projects.values()]))
+            .where(Agent.status == AgentStatus.ACTIVE)
+        ):
+            agent_by_project.setdefault(agent.project_id, agent)
+    except Exception as e:
+        logger.warning("MC sync preload failed: %s", e)
+        return
+
     for board_id, project_slug in BOARD_PROJECT_MAP.items():
         try:
-            project = session.exec(
-                select(Project).where(Project.slug == project_slug)
-            ).first()
+            project = projects.get(project_slug)
             if not project or project.status == ProjectStatus.DECOMMISSIONED:
                 continue
 
-            default_agent = session.exec(
-                select(Agent)
-                .where(Agent.project_id == project.id)
-                .where(Agent.status == AgentStatus.ACTIVE)
-            ).first()
+            default_agent = agent_by_project.get(project.id)
             if not default_agent:
                 continue
 
-            tasks = sync_tasks_for_project(board_id)
-            for task in tasks:
-                mc_task_id = task.get("id", "")
-                if not mc_task_id:
-                    continue
+            tasks = [t for t in sync_tasks_for_project(board_id) if t.get("id")]
+            seen_ids = set(session.exec(
+                select(Proposal.mc_task_id)
+                .where(Proposal.mc_task_id.in_([t["id"] for t in tasks]))
+            ).all())
 
-                existing = session.exec(
-                    select(Proposal).where(Proposal.mc_task_id == mc_task_id)
-                ).first()
-                if existing:
+            new_proposals = []
+            for task in tasks:
+                mc_task_id = task["id"]
+                if mc_task_id in seen_ids:
                     continue
+                seen_ids.add(mc_task_id)
 
-                mc_priority = task.get("priority", "medium").lower()
-                priority_map = {
-                    "critical": ProposalPriority.CRITICAL,
-                    "high": ProposalPriority.HIGH,
-                    "medium": ProposalPriority.MEDIUM,
-                    "low": ProposalPriority.LOW,
-                }
-                priority = priority_map.get(mc_priority, ProposalPriority.MEDIUM)
-
-                proposal = Proposal(
+                new_proposals.append(build_proposal(
+                    task,
                     agent_id=default_agent.id,
                     project_id=project.id,
-                    title=task.get("title", "Untitled MC Task"),
-                    description=task.get("description", ""),
-                    rationale=f"Synced from Mission Control task {mc_task_id}",
-                    priority=priority,
-                    status=ProposalStatus.PENDING,
-                    auto_approve=priority in (ProposalPriority.CRITICAL, ProposalPriority.HIGH),
-                    mc_task_id=mc_task_id,
-                    mc_board_id=board_id,
-                )
-                session.add(proposal)
+                    board_id=board_id,
+                ))
 
+            session.add_all(new_proposals)
             session.commit()
         except Exception as e:
             logger.warning("MC sync for board %s failed: %s", board_id, e)
@@ -137,11 +194,6 @@ def on_mission_complete(**kwargs):
     if not session or not mission:
         return
 
-    from agentloop.integrations.mission_control import (
-        report_agent_activity, update_task_status,
-    )
-    from agentloop.models import Agent, Proposal
-
     proposal = session.get(Proposal, mission.proposal_id)
     if not proposal or not proposal.mc_task_id or not proposal.mc_board_id:
         return
@@ -175,65 +227,76 @@ def on_stuck_check(**kwargs):
     if not session:
         return
 
-    from agentloop.integrations.mission_control import ask_user
-    from agentloop.models import (
-        Event, Mission, MissionStatus, Proposal, Step, StepStatus,
-    )
-
     try:
-        active_missions = session.exec(
-            select(Mission).where(Mission.status == MissionStatus.ACTIVE)
+        # Stuck = has a failed step and nothing left pending/claimed/running
+        failed_count = func.sum(case((Step.status == StepStatus.FAILED, 1), else_=0))
+        in_flight_count = func.sum(
+            case((Step.status.in_(_IN_FLIGHT_STEP_STATUSES), 1), else_=0)
+        )
+        stuck_missions = session.exec(
+            select(Mission)
+            .join(Step, Step.mission_id == Mission.id)
+            .where(Mission.status == MissionStatus.ACTIVE)
+            .group_by(Mission.id)
+            .having(failed_count > 0)
+            .having(in_flight_count == 0)
         ).all()
 
-        escalated = 0
-        for mission in active_missions:
-            steps = session.exec(
-                select(Step).where(Step.mission_id == mission.id)
-            ).all()
-            if not steps:
+        failed_steps = {}
+        if stuck_missions:
+            for step in session.exec(
+                select(Step)
+                .where(Step.mission_id.in_([m.id for m in stuck_missions]))
+                .where(Step.status == StepStatus.FAILED)
+            ):
+                failed_steps.setdefault(step.mission_id, step)
+
+        proposals = {}
+        if stuck_missions:
+            proposals = {
+                p.id: p
+                for p in session.exec(
+                    select(Proposal).where(
+                        Proposal.id.in_({m.proposal_id for m in stuck_missions})
+                    )
+                )
+            }
+
+        event_rows = []
+        for mission in stuck_missions:
+            proposal = proposals.get(mission.proposal_id)
+            if not proposal or not proposal.mc_board_id:
                 continue
 
-            has_failed = any(s.status == StepStatus.FAILED for s in steps)
-            has_pending = any(
-                s.status in (StepStatus.PENDING, StepStatus.RUNNING, StepStatus.CLAIMED)
-                for s in steps
+            failed_step = failed_steps[mission.id]
+            msg = (
+                f"Mission '{mission.title}' is stuck.\n"
+                f"Failed step: {failed_step.title} ({failed_step.step_type.value})\n"
+                f"Error: {failed_step.error or 'unknown'}\n\n"
+                f"Please advise: retry, skip, or cancel?"
             )
-
-            if has_failed and not has_pending:
-                proposal = session.get(Proposal, mission.proposal_id)
-                if not proposal or not proposal.mc_board_id:
-                    continue
-
-                failed_step = next(s for s in steps if s.status == StepStatus.FAILED)
-                msg = (
-                    f"Mission '{mission.title}' is stuck.\n"
-                    f"Failed step: {failed_step.title} ({failed_step.step_type.value})\n"
-                    f"Error: {failed_step.error or 'unknown'}\n\n"
-                    f"Please advise: retry, skip, or cancel?"
-                )
-                result = ask_user(
-                    proposal.mc_board_id,
-                    msg,
-                    correlation_id=f"stuck-mission-{mission.id}",
+            result = ask_user(
+                proposal.mc_board_id,
+                msg,
+                correlation_id=f"stuck-mission-{mission.id}",
+            )
+            if result:
+                logger.info(
+                    "Escalated stuck mission %s to human via MC", mission.id
                 )
-                if result:
-                    logger.info(
-                        "Escalated stuck mission %s to human via MC", mission.id
-                    )
-                    event = Event(
-                        event_type="mission.escalated",
-                        project_id=mission.project_id,
-                        source_agent_id=mission.assigned_agent_id,
-                        payload={
-                            "mission_id": str(mission.id),
-                            "failed_step_id": str(failed_step.id),
-                            "reason": "stuck_failed_steps",
-                        },
-                    )
-                    session.add(event)
-                    escalated += 1
-
-        if escalated:
+                event_rows.append({
+                    "event_type": "mission.escalated",
+                    "project_id": mission.project_id,
+                    "source_agent_id": mission.assigned_agent_id,
+                    "payload": {
+                        "mission_id": str(mission.id),
+                        "failed_step_id": str(failed_step.id),
+                        "reason": "stuck_failed_steps",
+                    },
+                })
+
+        if event_rows:
+            session.bulk_insert_mappings(Event, event_rows)
             session.commit()
     except Exception:
         logger.exception("Failed to escalate stuck missions")
@@ -4,36 +4,50 @@ These routes are contributed by the mission-control plugin and provide
 proxy access to Mission Control boards and tasks.
 """
 
+import asyncio
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import APIRouter, Depends
 from sqlmodel import Session, select
 
 from agentloop.database import get_session
 from agentloop.integrations.mission_control import (
-    get_boards, get_board_tasks, BOARD_PROJECT_MAP,
+    aget_boards, aget_board_tasks, BOARD_PROJECT_MAP, build_proposal,
     sync_tasks_for_project, report_agent_activity, update_task_status,
 )
 from agentloop.models import (
-    Agent, AgentStatus, Mission, MissionStatus, Project,
-    Proposal, ProposalPriority, ProposalStatus,
+    Agent, AgentStatus, Mission, MissionStatus, Project, Proposal,
 )
 
 router = APIRouter(prefix="/api/v1/mc", tags=["mission-control"])
 
+# Upper bound on concurrent outbound MC reports issued by /sync
+_MAX_REPORT_WORKERS = 8
+
+
+def _report_completed_mission(
+    board_id: str, task_id: str, agent_name: str, mission_title: str
+) -> None:
+    """Post a completion comment to an MC task and move it to review."""
+    report_agent_activity(
+        board_id, task_id, agent_name, f"Mission completed: {mission_title}",
+    )
+    update_task_status(board_id, task_id, "review")
+
 
 @router.get("/boards")
-def mc_boards():
+async def mc_boards():
     """Proxy — get all Mission Control boards with task counts."""
-    boards = get_boards()
+    boards = await aget_boards()
+    board_ids = [b.get("id", "") for b in boards]
+    board_tasks = await asyncio.gather(*(aget_board_tasks(bid) for bid in board_ids))
+
     result = []
-    for b in boards:
-        board_id = b.get("id", "")
-        tasks = get_board_tasks(board_id)
+    for b, board_id, tasks in zip(boards, board_ids, board_tasks):
         project_slug = BOARD_PROJECT_MAP.get(board_id, "unknown")
 
-        status_counts = {}
-        for t in tasks:
-            s = t.get("status", "unknown")
-            status_counts[s] = status_counts.get(s, 0) + 1
+        status_counts = Counter(t.get("status", "unknown") for t in tasks)
 
         result.append({
             "id": board_id,
@@ -41,15 +55,15 @@ def mc_boards():
             "description": b.get("description", ""),
             "project_slug": project_slug,
             "task_count": len(tasks),
-            "status_counts": status_counts,
+            "status_counts": dict(status_counts),
         })
     return {"boards": result}
 
 
 @router.get("/boards/{board_id}/tasks")
-def mc_board_tasks(board_id: str):
+async def mc_board_tasks(board_id: str):
     """Proxy — get tasks for a specific MC board."""
-    tasks = get_board_tasks(board_id)
+    tasks = await aget_board_tasks(board_id)
     return {"board_id": board_id, "tasks": tasks, "total": len(tasks)}
 
 
@@ -63,98 +77,87 @@ def sync_mission_control(session: Session = Depends(get_session)):
     created = []
     skipped = 0
     reported = []
+    outbound: list[tuple[str, str, str, str]] = []
+
+    projects = {
+        p.slug: p
+        for p in session.exec(
+            select(Project).where(Project.slug.in_(set(BOARD_PROJECT_MAP.values())))
+        )
+    }
+    agent_by_project = {}
+    for agent in session.exec(
+        select(Agent)
+        .where(Agent.project_id.in_([p.id for p in projects.values()]))
+        .where(Agent.status == AgentStatus.ACTIVE)
+    ):
+        agent_by_project.setdefault(agent.project_id, agent)
 
     for board_id, project_slug in BOARD_PROJECT_MAP.items():
-        project = session.exec(
-            select(Project).where(Project.slug == project_slug)
-        ).first()
+        project = projects.get(project_slug)
         if not project:
             continue
 
-        default_agent = session.exec(
-            select(Agent)
-            .where(Agent.project_id == project.id)
-            .where(Agent.status == AgentStatus.ACTIVE)
-        ).first()
+        default_agent = agent_by_project.get(project.id)
         if not default_agent:
             continue
 
-        tasks = sync_tasks_for_project(board_id)
-        for task in tasks:
-            mc_task_id = task.get("id", "")
-            if not mc_task_id:
-                continue
+        tasks = [t for t in sync_tasks_for_project(board_id) if t.get("id")]
+        seen_ids = set(session.exec(
+            select(Proposal.mc_task_id)
+            .where(Proposal.mc_task_id.in_([t["id"] for t in tasks]))
+        ).all())
 
-            existing = session.exec(
-                select(Proposal).where(Proposal.mc_task_id == mc_task_id)
-            ).first()
-            if existing:
+        new_proposals = []
+        for task in tasks:
+            mc_task_id = task["id"]
+            if mc_task_id in seen_ids:
                 skipped += 1
                 continue
+            seen_ids.add(mc_task_id)
 
-            mc_priority = task.get("priority", "medium").lower()
-            priority_map = {
-                "critical": ProposalPriority.CRITICAL,
-                "high": ProposalPriority.HIGH,
-                "medium": ProposalPriority.MEDIUM,
-                "low": ProposalPriority.LOW,
-            }
-            priority = priority_map.get(mc_priority, ProposalPriority.MEDIUM)
-
-            proposal = Proposal(
+            proposal = build_proposal(
+                task,
                 agent_id=default_agent.id,
                 project_id=project.id,
-                title=task.get("title", "Untitled MC Task"),
-                description=task.get("description", ""),
-                rationale=f"Synced from Mission Control task {mc_task_id}",
-                priority=priority,
-                status=ProposalStatus.PENDING,
-                auto_approve=priority in (ProposalPriority.CRITICAL, ProposalPriority.HIGH),
-                mc_task_id=mc_task_id,
-                mc_board_id=board_id,
+                board_id=board_id,
             )
-            session.add(proposal)
+            new_proposals.append(proposal)
             created.append({
                 "board": board_id,
                 "project": project_slug,
                 "mc_task_id": mc_task_id,
                 "title": proposal.title,
-                "priority": priority.value,
+                "priority": proposal.priority.value,
                 "auto_approve": proposal.auto_approve,
             })
+        session.add_all(new_proposals)
 
         # Outbound: completed missions → MC task status
-        completed_missions = session.exec(
-            select(Mission)
-            .join(Proposal)
+        completed_rows = session.exec(
+            select(Mission, Proposal.mc_task_id, Agent.name)
+            .join(Proposal, Mission.proposal_id == Proposal.id)
+            .outerjoin(Agent, Mission.assigned_agent_id == Agent.id)
             .where(Mission.project_id == project.id)
             .where(Mission.status == MissionStatus.COMPLETED)
             .where(Proposal.mc_task_id.isnot(None))
             .where(Proposal.mc_board_id == board_id)
         ).all()
 
-        for mission in completed_missions:
-            proposal = session.get(Proposal, mission.proposal_id)
-            if not proposal or not proposal.mc_task_id:
-                continue
-
-            agent_name = "AgentLoop"
-            if mission.assigned_agent_id:
-                agent = session.get(Agent, mission.assigned_agent_id)
-                if agent:
-                    agent_name = agent.name
-
-            report_agent_activity(
-                board_id, proposal.mc_task_id, agent_name,
-                f"Mission completed: {mission.title}",
-            )
-            update_task_status(board_id, proposal.mc_task_id, "review")
+        for mission, mc_task_id, assigned_name in completed_rows:
+            agent_name = assigned_name or "AgentLoop"
+            outbound.append((board_id, mc_task_id, agent_name, mission.title))
             reported.append({
-                "mc_task_id": proposal.mc_task_id,
+                "mc_task_id": mc_task_id,
                 "mission": mission.title,
                 "agent": agent_name,
             })
 
+    if outbound:
+        workers = min(len(outbound), _MAX_REPORT_WORKERS)
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            list(ex.map(lambda row: _report_completed_mission(*row), outbound))
+
     session.commit()
 
     return {
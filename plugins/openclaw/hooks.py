@@ -7,6 +7,8 @@ on startup.
 import logging
 from typing import Any, Dict, Optional
 
+from agentloop.integrations.openclaw import gateway_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -15,8 +17,6 @@ class OpenClawDispatcher:
 
     def dispatch(self, step_id: str, work_prompt: str, timeout: int,
                  agent_config: Optional[Dict[str, Any]] = None) -> dict:
-        from agentloop.integrations.openclaw import gateway_client
-
         result = gateway_client.dispatch_step(
             step_id, work_prompt, timeout=timeout, agent_config=agent_config,
         )
@@ -29,7 +29,6 @@ class OpenClawChatDispatcher:
     """ChatDispatcher implementation backed by the OpenClaw CLI."""
 
     def send(self, session_id: str, message: str, timeout: int) -> dict:
-        from agentloop.integrations.openclaw import gateway_client
         return gateway_client.run_agent(
             session_id=session_id, message=message, timeout=timeout,
         )
@@ -42,12 +41,10 @@ class OpenClawChatDispatcher:
         yield from llm.chat_stream(prompt=message)
 
     def extract_text(self, result: dict) -> str:
-        from agentloop.integrations.openclaw import gateway_client
         return gateway_client.extract_response_text(result)
 
     @property
     def available(self) -> bool:
-        from agentloop.integrations.openclaw import gateway_client
         return gateway_client.available
 
 
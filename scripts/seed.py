@@ -8,27 +8,131 @@ Usage:
 import argparse
 import sys
 import os
+from types import MappingProxyType
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from agentloop.database import create_db_and_tables, engine
 from agentloop.models import Agent, Project, AgentStatus, AgentAction, Trigger
-from sqlmodel import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlmodel import Session, insert, select
 from uuid_extensions import uuid7
 
+# Dialect-specific INSERTs that support ON CONFLICT; others fall back to
+# SELECT-then-INSERT in _insert_project()
+_DIALECT_INSERTS = {"sqlite": sqlite_insert, "postgresql": pg_insert}
+
+# Seed agents with office positions; read-only so seed() can't mutate them
+AGENTS = tuple(MappingProxyType(d) for d in (
+    {
+        "name": "Luna",
+        "role": "product_manager",
+        "description": "Reviews the board, identifies priorities, creates proposals.",
+        "position_x": 100.0,
+        "position_y": 200.0,
+        "target_x": 100.0,
+        "target_y": 200.0,
+        "avatar": "pm",
+        "config": {"auto_approve": False, "work_interval_minutes": 60},
+    },
+    {
+        "name": "Spark",
+        "role": "developer",
+        "description": "Claims coding tasks, implements features, fixes bugs.",
+        "position_x": 360.0,
+        "position_y": 200.0,
+        "target_x": 360.0,
+        "target_y": 200.0,
+        "avatar": "dev",
+        "config": {"auto_approve": True, "work_interval_minutes": 30},
+    },
+    {
+        "name": "Sage",
+        "role": "quality_assurance",
+        "description": "Reviews completed work, runs tests, validates quality.",
+        "position_x": 100.0,
+        "position_y": 400.0,
+        "target_x": 100.0,
+        "target_y": 400.0,
+        "avatar": "qa",
+        "config": {"auto_approve": True, "work_interval_minutes": 45},
+    },
+    {
+        "name": "Bolt",
+        "role": "deployer",
+        "description": "Handles deployment, CI/CD, infrastructure.",
+        "position_x": 360.0,
+        "position_y": 400.0,
+        "target_x": 360.0,
+        "target_y": 400.0,
+        "avatar": "deploy",
+        "config": {"auto_approve": False, "work_interval_minutes": 120},
+    },
+    {
+        "name": "Shield",
+        "role": "security",
+        "description": "Reviews code for security vulnerabilities, validates access controls.",
+        "position_x": 230.0,
+        "position_y": 300.0,
+        "target_x": 230.0,
+        "target_y": 300.0,
+        "avatar": "security",
+        "config": {"auto_approve": False, "work_interval_minutes": 90},
+    },
+))
+
+# Seed triggers
+TRIGGERS = tuple(MappingProxyType(d) for d in (
+    {
+        "name": "qa_on_dev_complete",
+        "event_pattern": {"event_type": "step.completed", "conditions": {"step_type": "code"}},
+        "action": {"type": "create_step", "step_type": "review", "assign_role": "quality_assurance", "title_template": "Review: {step_title}"},
+    },
+    {
+        "name": "security_on_code_complete",
+        "event_pattern": {"event_type": "step.completed", "conditions": {"step_type": "code"}},
+        "action": {"type": "create_step", "step_type": "security", "assign_role": "security", "title_template": "Security review: {step_title}"},
+    },
+    {
+        "name": "mission_complete_check",
+        "event_pattern": {"event_type": "step.completed"},
+        "action": {"type": "evaluate_mission_completion"},
+    },
+))
+
+
+def _insert_project(session: Session, **values) -> bool:
+    """Insert the project unless its slug exists; return whether it was added."""
+    upsert = _DIALECT_INSERTS.get(engine.dialect.name)
+    if upsert is None:
+        existing = session.exec(
+            select(Project.id).where(Project.slug == values["slug"])
+        ).first()
+        if existing is not None:
+            return False
+        session.execute(insert(Project.__table__).values(**values))
+        return True
+
+    # Insert-or-skip on slug in one statement instead of SELECT-then-INSERT
+    result = session.execute(
+        upsert(Project.__table__)
+        .values(**values)
+        .on_conflict_do_nothing(index_elements=["slug"])
+    )
+    return result.rowcount != 0
+
 
 def seed(name: str, slug: str, description: str, repo_path: str, board_id: str):
     create_db_and_tables()
 
     with Session(engine) as session:
-        from sqlmodel import select
-        existing = session.exec(select(Project).where(Project.slug == slug)).first()
-        if existing:
-            print(f"Project '{slug}' already seeded. Skipping.")
-            return
-
-        project = Project(
-            id=uuid7(),
+        # IDs are generated client-side, so children can reference the
+        # project without flushing it first
+        project_id = uuid7()
+        added = _insert_project(
+            session,
+            id=project_id,
             name=name,
             slug=slug,
             description=description,
@@ -37,105 +141,25 @@ def seed(name: str, slug: str, description: str, repo_path: str, board_id: str):
                 "mission_control_board_id": board_id,
             },
         )
-        session.add(project)
-        session.flush()
+        if not added:
+            print(f"Project '{slug}' already seeded. Skipping.")
+            return
 
-        # Create agents with office positions
-        agents_data = [
-            {
-                "name": "Luna",
-                "role": "product_manager",
-                "description": "Reviews the board, identifies priorities, creates proposals.",
-                "position_x": 100.0,
-                "position_y": 200.0,
-                "target_x": 100.0,
-                "target_y": 200.0,
-                "avatar": "pm",
-                "config": {"auto_approve": False, "work_interval_minutes": 60},
-            },
-            {
-                "name": "Spark",
-                "role": "developer",
-                "description": "Claims coding tasks, implements features, fixes bugs.",
-                "position_x": 360.0,
-                "position_y": 200.0,
-                "target_x": 360.0,
-                "target_y": 200.0,
-                "avatar": "dev",
-                "config": {"auto_approve": True, "work_interval_minutes": 30},
-            },
-            {
-                "name": "Sage",
-                "role": "quality_assurance",
-                "description": "Reviews completed work, runs tests, validates quality.",
-                "position_x": 100.0,
-                "position_y": 400.0,
-                "target_x": 100.0,
-                "target_y": 400.0,
-                "avatar": "qa",
-                "config": {"auto_approve": True, "work_interval_minutes": 45},
-            },
+        session.execute(insert(Agent.__table__).values([
             {
-                "name": "Bolt",
-                "role": "deployer",
-                "description": "Handles deployment, CI/CD, infrastructure.",
-                "position_x": 360.0,
-                "position_y": 400.0,
-                "target_x": 360.0,
-                "target_y": 400.0,
-                "avatar": "deploy",
-                "config": {"auto_approve": False, "work_interval_minutes": 120},
-            },
-            {
-                "name": "Shield",
-                "role": "security",
-                "description": "Reviews code for security vulnerabilities, validates access controls.",
-                "position_x": 230.0,
-                "position_y": 300.0,
-                "target_x": 230.0,
-                "target_y": 300.0,
-                "avatar": "security",
-                "config": {"auto_approve": False, "work_interval_minutes": 90},
-            },
-        ]
-
-        for data in agents_data:
-            agent = Agent(
-                id=uuid7(),
-                project_id=project.id,
-                status=AgentStatus.ACTIVE,
-                current_action=AgentAction.IDLE,
+                "id": uuid7(),
+                "project_id": project_id,
+                "status": AgentStatus.ACTIVE,
+                "current_action": AgentAction.IDLE,
                 **data,
-            )
-            session.add(agent)
-
-        # Create triggers
-        triggers_data = [
-            {
-                "name": "qa_on_dev_complete",
-                "event_pattern": {"event_type": "step.completed", "conditions": {"step_type": "code"}},
-                "action": {"type": "create_step", "step_type": "review", "assign_role": "quality_assurance", "title_template": "Review: {step_title}"},
-            },
-            {
-                "name": "security_on_code_complete",
-                "event_pattern": {"event_type": "step.completed", "conditions": {"step_type": "code"}},
-                "action": {"type": "create_step", "step_type": "security", "assign_role": "security", "title_template": "Security review: {step_title}"},
-            },
-            {
-                "name": "mission_complete_check",
-                "event_pattern": {"event_type": "step.completed"},
-                "action": {"type": "evaluate_mission_completion"},
-            },
-        ]
+            }
+            for data in AGENTS
+        ]))
 
-        for data in triggers_data:
-            trigger = Trigger(
-                id=uuid7(),
-                project_id=project.id,
-                enabled=True,
-                **data,
-            )
-            session.add(trigger)
+        session.execute(insert(Trigger.__table__).values([
+            {"id": uuid7(), "project_id": project_id, "enabled": True, **data}
+            for data in TRIGGERS
+        ]))
 
         session.commit()
         print(f"Seeded: {name} project + 5 agents (Luna, Spark, Sage, Bolt, Shield) + 3 triggers")
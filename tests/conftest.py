@@ -1,11 +1,14 @@
 """Shared fixtures for AgentLoop tests."""
 
+import importlib.util
 import os
 import pytest
-from typing import Generator
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generator, Iterable, List, Optional, TypeVar
 from uuid import UUID
 
 from fastapi.testclient import TestClient
+from sqlalchemy import Connection, event
 from sqlmodel import Session, SQLModel, create_engine
 from sqlmodel.pool import StaticPool
 from uuid_extensions import uuid7
@@ -34,49 +37,163 @@ from agentloop.models import (
     Trigger,
 )
 from agentloop.database import get_session
+from agentloop.engine.orchestrator import OrchestrationEngine
 from agentloop.main import app
 
+T = TypeVar("T")
+
 
 # ─── Database fixtures ───
 
 
-@pytest.fixture(name="engine")
+@pytest.fixture(name="engine", scope="session")
 def fixture_engine():
-    """In-memory SQLite engine for tests."""
+    """In-memory SQLite engine shared by the whole test session."""
     eng = create_engine(
         "sqlite://",
         connect_args={"check_same_thread": False},
         poolclass=StaticPool,
     )
+
+    # pysqlite's own transaction handling breaks SAVEPOINT; let SQLAlchemy
+    # emit BEGIN itself.
+    @event.listens_for(eng, "connect")
+    def _disable_pysqlite_begin(dbapi_conn, _):
+        dbapi_conn.isolation_level = None
+
+    @event.listens_for(eng, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    # The database is throwaway, so skip durability work on every commit
+    @event.listens_for(eng, "connect")
+    def _pragmas(dbapi_conn, _):
+        cur = dbapi_conn.cursor()
+        cur.execute("PRAGMA synchronous=OFF")
+        cur.execute("PRAGMA journal_mode=MEMORY")
+        cur.execute("PRAGMA temp_store=MEMORY")
+        cur.close()
+
     SQLModel.metadata.create_all(eng)
     return eng
 
 
+@pytest.fixture(name="connection")
+def fixture_connection(engine) -> Generator[Connection, None, None]:
+    """Per-test connection whose outer transaction is rolled back afterwards."""
+    with engine.connect() as conn:
+        trans = conn.begin()
+        yield conn
+        trans.rollback()
+
+
+def _savepoint_session(connection: Connection) -> Session:
+    """Session whose commits only release a SAVEPOINT on ``connection``.
+
+    Objects are not expired on commit, so reading attributes back after a
+    factory call doesn't reload the row.
+    """
+    return Session(
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+        expire_on_commit=False,
+    )
+
+
 @pytest.fixture(name="session")
-def fixture_session(engine) -> Generator[Session, None, None]:
+def fixture_session(connection) -> Generator[Session, None, None]:
     """DB session backed by the in-memory engine."""
-    with Session(engine) as session:
+    with _savepoint_session(connection) as session:
         yield session
 
 
+@pytest.fixture(name="app_client", scope="session")
+def fixture_app_client() -> Generator[TestClient, None, None]:
+    """TestClient started once; app startup/shutdown run a single time."""
+    with TestClient(app) as c:
+        yield c
+
+
 @pytest.fixture(name="client")
-def fixture_client(engine) -> Generator[TestClient, None, None]:
+def fixture_client(app_client, connection) -> Generator[TestClient, None, None]:
     """FastAPI TestClient wired to the test database."""
 
     def _override_session():
-        with Session(engine) as session:
+        with _savepoint_session(connection) as session:
             yield session
 
     app.dependency_overrides[get_session] = _override_session
-    with TestClient(app) as c:
-        yield c
+    yield app_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(name="bare_client")
+def fixture_bare_client(app_client) -> Generator[TestClient, None, None]:
+    """TestClient for endpoints that never reach the database.
+
+    Skips the per-test connection and rollback that ``client`` sets up;
+    any endpoint that asks for a session fails the test instead of
+    silently using the app's own engine.
+    """
+
+    def _no_session():
+        raise AssertionError("bare_client endpoint requested a DB session")
+
+    app.dependency_overrides[get_session] = _no_session
+    yield app_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(name="orch", scope="session")
+def fixture_orch() -> OrchestrationEngine:
+    """OrchestrationEngine without plugins; it keeps no per-tick state."""
+    return OrchestrationEngine()
+
+
+def _load_plugin_module(name: str, path: str):
+    """Import a plugin source file by path; plugin dirs aren't packages."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(name="mc_hooks_module", scope="session")
+def fixture_mc_hooks_module():
+    """The mission-control plugin's hooks module, loaded once per session."""
+    return _load_plugin_module("mc_hooks", "plugins/mission-control/hooks.py")
+
+
+@pytest.fixture(name="mc_dashboard_module", scope="session")
+def fixture_mc_dashboard_module():
+    """The mission-control plugin's dashboard routes, loaded once per session."""
+    return _load_plugin_module(
+        "mc_dashboard", "plugins/mission-control/routes/dashboard.py"
+    )
+
+
+@pytest.fixture(name="llm_provider_module", scope="session")
+def fixture_llm_provider_module():
+    """The llm plugin's provider module, loaded once per session."""
+    return _load_plugin_module("llm_provider", "plugins/llm/provider.py")
+
+
 # ─── Factory helpers ───
 
 
-def make_project(session: Session, **overrides) -> Project:
+def _persist(session: Session, obj: T, commit: bool = True) -> T:
+    """Add ``obj`` to the session and commit it unless told not to.
+
+    IDs and defaults are filled in client-side, so the row never needs to be
+    re-read after the commit.
+    """
+    session.add(obj)
+    if commit:
+        session.commit()
+    return obj
+
+
+def make_project(session: Session, commit: bool = True, **overrides) -> Project:
     """Create and persist a Project."""
     data = {
         "name": "Test Project",
@@ -85,14 +202,15 @@ def make_project(session: Session, **overrides) -> Project:
         "config": {},
     }
     data.update(overrides)
-    obj = Project(**data)
-    session.add(obj)
-    session.commit()
-    session.refresh(obj)
-    return obj
+    return _persist(session, Project(**data), commit)
 
 
-def make_agent(session: Session, project: Project, **overrides) -> Agent:
+def make_agent(
+    session: Session,
+    project: Project,
+    commit: bool = True,
+    **overrides,
+) -> Agent:
     """Create and persist an Agent."""
     data = {
         "name": "test-agent",
@@ -107,15 +225,15 @@ def make_agent(session: Session, project: Project, **overrides) -> Agent:
         "target_y": 3.0,
     }
     data.update(overrides)
-    obj = Agent(**data)
-    session.add(obj)
-    session.commit()
-    session.refresh(obj)
-    return obj
+    return _persist(session, Agent(**data), commit)
 
 
 def make_proposal(
-    session: Session, agent: Agent, project: Project, **overrides
+    session: Session,
+    agent: Agent,
+    project: Project,
+    commit: bool = True,
+    **overrides,
 ) -> Proposal:
     """Create and persist a Proposal."""
     data = {
@@ -129,15 +247,16 @@ def make_proposal(
         "auto_approve": True,
     }
     data.update(overrides)
-    obj = Proposal(**data)
-    session.add(obj)
-    session.commit()
-    session.refresh(obj)
-    return obj
+    return _persist(session, Proposal(**data), commit)
 
 
 def make_mission(
-    session: Session, proposal: Proposal, project: Project, agent: Agent = None, **overrides
+    session: Session,
+    proposal: Proposal,
+    project: Project,
+    agent: Agent = None,
+    commit: bool = True,
+    **overrides,
 ) -> Mission:
     """Create and persist a Mission."""
     data = {
@@ -149,14 +268,15 @@ def make_mission(
         "assigned_agent_id": agent.id if agent else None,
     }
     data.update(overrides)
-    obj = Mission(**data)
-    session.add(obj)
-    session.commit()
-    session.refresh(obj)
-    return obj
+    return _persist(session, Mission(**data), commit)
 
 
-def make_step(session: Session, mission: Mission, **overrides) -> Step:
+def make_step(
+    session: Session,
+    mission: Mission,
+    commit: bool = True,
+    **overrides,
+) -> Step:
     """Create and persist a Step."""
     data = {
         "mission_id": mission.id,
@@ -167,14 +287,15 @@ def make_step(session: Session, mission: Mission, **overrides) -> Step:
         "status": StepStatus.PENDING,
     }
     data.update(overrides)
-    obj = Step(**data)
-    session.add(obj)
-    session.commit()
-    session.refresh(obj)
-    return obj
+    return _persist(session, Step(**data), commit)
 
 
-def make_event(session: Session, project: Project, **overrides) -> Event:
+def make_event(
+    session: Session,
+    project: Project,
+    commit: bool = True,
+    **overrides,
+) -> Event:
     """Create and persist an Event."""
     data = {
         "event_type": "test.event",
@@ -182,14 +303,15 @@ def make_event(session: Session, project: Project, **overrides) -> Event:
         "payload": {"key": "value"},
     }
     data.update(overrides)
-    obj = Event(**data)
-    session.add(obj)
-    session.commit()
-    session.refresh(obj)
-    return obj
+    return _persist(session, Event(**data), commit)
 
 
-def make_trigger(session: Session, project: Project, **overrides) -> Trigger:
+def make_trigger(
+    session: Session,
+    project: Project,
+    commit: bool = True,
+    **overrides,
+) -> Trigger:
     """Create and persist a Trigger."""
     data = {
         "project_id": project.id,
@@ -199,8 +321,78 @@ def make_trigger(session: Session, project: Project, **overrides) -> Trigger:
         "enabled": True,
     }
     data.update(overrides)
-    obj = Trigger(**data)
-    session.add(obj)
+    return _persist(session, Trigger(**data), commit)
+
+
+@dataclass
+class Graph:
+    """A project with one agent, proposal, mission and its steps."""
+
+    project: Project
+    agent: Agent
+    proposal: Proposal
+    mission: Mission
+    steps: List[Step] = field(default_factory=list)
+
+    @property
+    def step(self) -> Step:
+        """The first step, for graphs built around a single one."""
+        return self.steps[0]
+
+
+def make_graph(
+    session: Session,
+    with_step: bool = True,
+    agent_overrides: Optional[Dict[str, Any]] = None,
+    mission_overrides: Optional[Dict[str, Any]] = None,
+    **step_overrides,
+) -> Graph:
+    """Create a Project → Agent → Proposal → Mission → Step chain in one commit.
+
+    IDs are generated client-side by the models, so children reference their
+    parents without intermediate flushes.
+    """
+    project = make_project(session, commit=False)
+    agent = make_agent(session, project, commit=False, **(agent_overrides or {}))
+    proposal = make_proposal(session, agent, project, commit=False)
+    mission = make_mission(
+        session, proposal, project, agent, commit=False, **(mission_overrides or {})
+    )
+    steps = []
+    if with_step:
+        steps.append(make_step(session, mission, commit=False, **step_overrides))
     session.commit()
-    session.refresh(obj)
-    return obj
+    return Graph(project, agent, proposal, mission, steps)
+
+
+def make_active_mission(
+    session: Session,
+    steps: Iterable[Dict[str, Any]] = (),
+    **proposal_overrides,
+) -> Graph:
+    """Create an ACTIVE mission from an approved proposal in one commit.
+
+    ``steps`` holds per-step overrides; each step gets ``order_index`` and
+    ``title`` from its position unless the overrides say otherwise.
+    """
+    project = make_project(session, commit=False)
+    agent = make_agent(session, project, commit=False)
+    proposal = make_proposal(
+        session,
+        agent,
+        project,
+        commit=False,
+        **{"status": ProposalStatus.APPROVED, **proposal_overrides},
+    )
+    mission = make_mission(session, proposal, project, agent, commit=False)
+    created = [
+        make_step(
+            session,
+            mission,
+            commit=False,
+            **{"order_index": i, "title": f"Step {i}", **overrides},
+        )
+        for i, overrides in enumerate(steps)
+    ]
+    session.commit()
+    return Graph(project, agent, proposal, mission, created)
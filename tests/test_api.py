@@ -1,8 +1,14 @@
 """Tests for critical API endpoints."""
 
+import pytest
+from fastapi.responses import JSONResponse
+
+from agentloop.main import plugin_manager
 from agentloop.models import AgentStatus, MissionStatus, ProposalStatus, StepStatus
+from agentloop.plugin import FrontendTab
 from tests.conftest import (
     make_agent,
+    make_graph,
     make_mission,
     make_project,
     make_proposal,
@@ -13,9 +19,9 @@ from tests.conftest import (
 # ─── Health endpoints ───
 
 
-def test_healthz(client):
+def test_healthz(bare_client):
     """GET /healthz should return healthy."""
-    r = client.get("/healthz")
+    r = bare_client.get("/healthz")
     assert r.status_code == 200
     assert r.json()["status"] == "healthy"
 
@@ -30,200 +36,152 @@ def test_deep_health(client, engine):
     assert "database" in data["checks"]
 
 
-def test_root(client):
+def test_root(bare_client):
     """GET / should return app info."""
-    r = client.get("/")
+    r = bare_client.get("/")
     assert r.status_code == 200
     assert r.json()["name"] == "AgentLoop"
 
 
-# ─── Projects ───
+# ─── Plugins ───
 
 
-def test_create_and_list_project(client):
-    """POST /api/v1/projects and GET /api/v1/projects."""
-    r = client.post(
-        "/api/v1/projects",
-        json={
-            "name": "TestProj",
-            "slug": "test-proj",
-            "description": "desc",
-            "config": {},
-        },
+def test_plugin_tabs_matches_json_response(bare_client, monkeypatch):
+    """The pre-encoded tabs body is what JSONResponse would have sent."""
+    # The llm plugin ships with a manifest, so it's always loaded
+    plugin = plugin_manager.plugins["llm"]
+    manifest = plugin.manifest.model_copy(
+        update={
+            "frontend_tabs": [
+                FrontendTab(id="board", label="Tâches ✓", icon="kanban"),
+                FrontendTab(id="logs", label="Logs", component_path="./Logs"),
+            ]
+        }
     )
-    assert r.status_code == 201
-    project_id = r.json()["id"]
+    monkeypatch.setattr(plugin, "manifest", manifest)
+    # Register the cached fields with monkeypatch so the reindex is undone
+    monkeypatch.setattr(plugin_manager, "_frontend_tabs", [])
+    monkeypatch.setattr(plugin_manager, "_frontend_tabs_bytes", b"[]")
+    plugin_manager._index_frontend_tabs()
+    tabs = plugin_manager.get_frontend_tabs()
+    assert [(t["plugin"], t["id"]) for t in tabs] == [("llm", "board"), ("llm", "logs")]
 
-    r2 = client.get("/api/v1/projects")
-    assert r2.status_code == 200
-    slugs = [p["slug"] for p in r2.json()]
-    assert "test-proj" in slugs
+    r = bare_client.get("/api/v1/plugins/tabs")
+    expected = JSONResponse(tabs)
 
+    assert r.status_code == 200
+    assert r.content == expected.body
+    assert r.headers["content-type"] == expected.headers["content-type"]
+    assert [t["label"] for t in r.json()] == ["Tâches ✓", "Logs"]
 
-# ─── Agents ───
 
+# ─── Entity creation ───
 
-def test_create_and_get_agent(client):
-    """Create a project, then an agent, then fetch it."""
-    proj = client.post(
-        "/api/v1/projects",
-        json={
-            "name": "AgentTest",
-            "slug": "agent-test",
-            "description": "d",
-            "config": {},
-        },
-    ).json()
 
-    r = client.post(
-        "/api/v1/agents",
-        json={
-            "name": "bot-1",
-            "role": "dev",
-            "description": "A dev agent",
-            "project_id": proj["id"],
-            "config": {},
-        },
-    )
-    assert r.status_code == 201
-    agent_id = r.json()["id"]
+def _project_payload(graph):
+    return {
+        "name": "TestProj",
+        "slug": "test-proj",
+        "description": "desc",
+        "config": {},
+    }
 
-    r2 = client.get(f"/api/v1/agents/{agent_id}")
-    assert r2.status_code == 200
-    assert r2.json()["name"] == "bot-1"
 
+def _agent_payload(graph):
+    return {
+        "name": "bot-1",
+        "role": "dev",
+        "description": "A dev agent",
+        "project_id": str(graph.project.id),
+        "config": {},
+    }
 
-def test_list_agents_filters_by_project(client):
-    """Agents should be filterable by project_id."""
-    p1 = client.post(
-        "/api/v1/projects",
-        json={"name": "P1", "slug": "p1", "description": "d", "config": {}},
-    ).json()
-    p2 = client.post(
-        "/api/v1/projects",
-        json={"name": "P2", "slug": "p2", "description": "d", "config": {}},
-    ).json()
-
-    client.post(
-        "/api/v1/agents",
-        json={"name": "a1", "role": "dev", "description": "d", "project_id": p1["id"], "config": {}},
-    )
-    client.post(
-        "/api/v1/agents",
-        json={"name": "a2", "role": "dev", "description": "d", "project_id": p2["id"], "config": {}},
-    )
 
-    r = client.get(f"/api/v1/agents?project_id={p1['id']}")
-    assert r.status_code == 200
-    names = [a["name"] for a in r.json()]
-    assert "a1" in names
-    assert "a2" not in names
+def _proposal_payload(graph):
+    return {
+        "agent_id": str(graph.agent.id),
+        "project_id": str(graph.project.id),
+        "title": "Test proposal",
+        "description": "desc",
+        "rationale": "reason",
+    }
 
 
-# ─── Proposals ───
+def _mission_payload(graph):
+    return {
+        "proposal_id": str(graph.proposal.id),
+        "project_id": str(graph.project.id),
+        "title": "Test mission",
+        "description": "desc",
+        "assigned_agent_id": str(graph.agent.id),
+    }
 
 
-def test_create_proposal(client):
-    """Create a proposal via the API."""
-    proj = client.post(
-        "/api/v1/projects",
-        json={"name": "PP", "slug": "pp", "description": "d", "config": {}},
-    ).json()
-    agent = client.post(
-        "/api/v1/agents",
-        json={"name": "a", "role": "d", "description": "d", "project_id": proj["id"], "config": {}},
-    ).json()
+# (collection, payload builder, field → accepted values in the response)
+ENTITY_CASES = [
+    ("projects", _project_payload, {"slug": {"test-proj"}}),
+    ("agents", _agent_payload, {"name": {"bot-1"}}),
+    ("proposals", _proposal_payload, {"status": {"draft", "pending"}}),
+    ("missions", _mission_payload, {"status": {"planned"}}),
+]
 
-    r = client.post(
-        "/api/v1/proposals",
-        json={
-            "agent_id": agent["id"],
-            "project_id": proj["id"],
-            "title": "Test proposal",
-            "description": "desc",
-            "rationale": "reason",
-        },
-    )
+
+@pytest.fixture
+def preseeded(session):
+    """Project, agent, proposal and mission for payloads to reference."""
+    return make_graph(session, with_step=False)
+
+
+@pytest.mark.parametrize(
+    "path,build,expected", ENTITY_CASES, ids=[c[0] for c in ENTITY_CASES]
+)
+def test_create_get_and_list(client, preseeded, path, build, expected):
+    """POST creates the entity; it is then fetchable and listed."""
+    r = client.post(f"/api/v1/{path}", json=build(preseeded))
     assert r.status_code == 201
-    assert r.json()["status"] in ("draft", "pending")
+    data = r.json()
+    for field, accepted in expected.items():
+        assert data[field] in accepted
 
+    r2 = client.get(f"/api/v1/{path}/{data['id']}")
+    assert r2.status_code == 200
+    assert r2.json()["id"] == data["id"]
 
-# ─── Missions ───
+    r3 = client.get(f"/api/v1/{path}")
+    assert r3.status_code == 200
+    assert data["id"] in [item["id"] for item in r3.json()]
 
 
-def test_create_mission(client):
-    """Create a mission via the API."""
-    proj = client.post(
-        "/api/v1/projects",
-        json={"name": "MP", "slug": "mp", "description": "d", "config": {}},
-    ).json()
-    agent = client.post(
-        "/api/v1/agents",
-        json={"name": "a", "role": "d", "description": "d", "project_id": proj["id"], "config": {}},
-    ).json()
-    proposal = client.post(
-        "/api/v1/proposals",
-        json={
-            "agent_id": agent["id"],
-            "project_id": proj["id"],
-            "title": "M-prop",
-            "description": "d",
-            "rationale": "r",
-        },
-    ).json()
+# ─── Agents ───
 
-    r = client.post(
-        "/api/v1/missions",
-        json={
-            "proposal_id": proposal["id"],
-            "project_id": proj["id"],
-            "title": "Test mission",
-            "description": "desc",
-            "assigned_agent_id": agent["id"],
-        },
-    )
-    assert r.status_code == 201
-    assert r.json()["status"] == "planned"
+
+def test_list_agents_filters_by_project(client, session):
+    """Agents should be filterable by project_id."""
+    p1 = make_project(session, name="P1", slug="p1")
+    p2 = make_project(session, name="P2", slug="p2")
+    make_agent(session, p1, name="a1")
+    make_agent(session, p2, name="a2")
+
+    r = client.get(f"/api/v1/agents?project_id={p1.id}")
+    assert r.status_code == 200
+    names = [a["name"] for a in r.json()]
+    assert "a1" in names
+    assert "a2" not in names
 
 
 # ─── Steps ───
 
 
-def test_create_and_claim_step(client):
+def test_create_and_claim_step(client, preseeded):
     """Create a step via mission endpoint and claim it for an agent."""
-    proj = client.post(
-        "/api/v1/projects",
-        json={"name": "SP", "slug": "sp", "description": "d", "config": {}},
-    ).json()
-    agent = client.post(
-        "/api/v1/agents",
-        json={"name": "a", "role": "d", "description": "d", "project_id": proj["id"], "config": {}},
-    ).json()
-    proposal = client.post(
-        "/api/v1/proposals",
-        json={
-            "agent_id": agent["id"],
-            "project_id": proj["id"],
-            "title": "SP-prop",
-            "description": "d",
-            "rationale": "r",
-        },
-    ).json()
-    mission = client.post(
-        "/api/v1/missions",
-        json={
-            "proposal_id": proposal["id"],
-            "project_id": proj["id"],
-            "title": "SM",
-            "description": "d",
-        },
-    ).json()
+    mission_id = str(preseeded.mission.id)
+    agent_id = str(preseeded.agent.id)
 
     # Steps are created via /api/v1/missions/{id}/steps
     r_step = client.post(
-        f"/api/v1/missions/{mission['id']}/steps",
+        f"/api/v1/missions/{mission_id}/steps",
         json={
-            "mission_id": mission["id"],
+            "mission_id": mission_id,
             "title": "Do work",
             "description": "d",
             "step_type": "code",
@@ -236,11 +194,11 @@ def test_create_and_claim_step(client):
 
     r = client.post(
         f"/api/v1/steps/{step['id']}/claim",
-        json={"agent_id": agent["id"]},
+        json={"agent_id": agent_id},
     )
     assert r.status_code == 200
     assert r.json()["status"] == "claimed"
-    assert r.json()["claimed_by_agent_id"] == agent["id"]
+    assert r.json()["claimed_by_agent_id"] == agent_id
 
 
 # ─── Orchestrator ───
@@ -253,8 +211,8 @@ def test_orchestrator_tick_endpoint(client):
     assert "triggers_evaluated" in r.json()
 
 
-def test_orchestrator_status(client):
+def test_orchestrator_status(bare_client):
     """GET /api/v1/orchestrator/status should return running."""
-    r = client.get("/api/v1/orchestrator/status")
+    r = bare_client.get("/api/v1/orchestrator/status")
     assert r.status_code == 200
     assert r.json()["status"] == "running"
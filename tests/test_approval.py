@@ -1,20 +1,34 @@
 """Tests for the ApprovalEngine."""
 
+import pytest
+
 from agentloop.engine.approval import ApprovalEngine
 from agentloop.models import ProposalPriority, ProposalStatus
 from tests.conftest import make_agent, make_project, make_proposal
 
 
-def test_auto_approve_with_flag(session):
-    """Proposals with auto_approve=True and matching keywords get approved."""
+@pytest.fixture(scope="module")
+def approval():
+    """ApprovalEngine is stateless, so one instance serves the module."""
+    return ApprovalEngine()
+
+
+@pytest.fixture
+def project_agent(session):
+    """A project and an agent to hang proposals off."""
     project = make_project(session)
-    agent = make_agent(session, project)
-    proposal = make_proposal(
-        session, agent, project, auto_approve=True, title="Fix typo in README"
-    )
+    return project, make_agent(session, project)
+
 
-    engine = ApprovalEngine()
-    processed = engine.process_pending_approvals(session)
+@pytest.mark.parametrize(
+    "title", ["Fix typo in README", "Update documentation", "Add test coverage"]
+)
+def test_auto_approve_keyword(session, approval, project_agent, title):
+    """Proposals with auto_approve=True and matching keywords get approved."""
+    project, agent = project_agent
+    proposal = make_proposal(session, agent, project, auto_approve=True, title=title)
+
+    processed = approval.process_pending_approvals(session)
 
     assert len(processed) == 1
     session.refresh(proposal)
@@ -22,10 +36,9 @@ def test_auto_approve_with_flag(session):
     assert proposal.reviewed_by == "system"
 
 
-def test_no_auto_approve_without_flag(session):
+def test_no_auto_approve_without_flag(session, approval, project_agent):
     """Proposals with auto_approve=False should NOT be auto-approved."""
-    project = make_project(session)
-    agent = make_agent(session, project)
+    project, agent = project_agent
     proposal = make_proposal(
         session,
         agent,
@@ -35,50 +48,21 @@ def test_no_auto_approve_without_flag(session):
         priority=ProposalPriority.HIGH,
     )
 
-    engine = ApprovalEngine()
-    processed = engine.process_pending_approvals(session)
+    processed = approval.process_pending_approvals(session)
 
     assert len(processed) == 0
     session.refresh(proposal)
     assert proposal.status == ProposalStatus.PENDING
 
 
-def test_auto_approve_docs_keyword(session):
-    """Proposals about docs get auto-approved when auto_approve=True."""
-    project = make_project(session)
-    agent = make_agent(session, project)
-    proposal = make_proposal(
-        session, agent, project, auto_approve=True, title="Update documentation"
-    )
-
-    engine = ApprovalEngine()
-    processed = engine.process_pending_approvals(session)
-    assert len(processed) == 1
-
-
-def test_auto_approve_test_keyword(session):
-    """Proposals about tests get auto-approved when auto_approve=True."""
-    project = make_project(session)
-    agent = make_agent(session, project)
-    proposal = make_proposal(
-        session, agent, project, auto_approve=True, title="Add test coverage"
-    )
-
-    engine = ApprovalEngine()
-    processed = engine.process_pending_approvals(session)
-    assert len(processed) == 1
-
-
-def test_manual_approve(session):
+def test_manual_approve(session, approval, project_agent):
     """approve_proposal should transition a pending proposal to APPROVED."""
-    project = make_project(session)
-    agent = make_agent(session, project)
+    project, agent = project_agent
     proposal = make_proposal(
         session, agent, project, auto_approve=False, title="Refactor auth"
     )
 
-    engine = ApprovalEngine()
-    result = engine.approve_proposal(proposal, "human-reviewer", session)
+    result = approval.approve_proposal(proposal, "human-reviewer", session)
 
     assert result is True
     session.refresh(proposal)
@@ -86,16 +70,14 @@ def test_manual_approve(session):
     assert proposal.reviewed_by == "human-reviewer"
 
 
-def test_manual_reject(session):
+def test_manual_reject(session, approval, project_agent):
     """reject_proposal should transition a pending proposal to REJECTED."""
-    project = make_project(session)
-    agent = make_agent(session, project)
+    project, agent = project_agent
     proposal = make_proposal(
         session, agent, project, auto_approve=False, title="Bad idea"
     )
 
-    engine = ApprovalEngine()
-    result = engine.reject_proposal(proposal, "human-reviewer", "Too risky", session)
+    result = approval.reject_proposal(proposal, "human-reviewer", "Too risky", session)
 
     assert result is True
     session.refresh(proposal)
@@ -103,25 +85,22 @@ def test_manual_reject(session):
     assert "REJECTED: Too risky" in proposal.rationale
 
 
-def test_cannot_approve_non_pending(session):
+def test_cannot_approve_non_pending(session, approval, project_agent):
     """Approving an already-approved proposal should return False."""
-    project = make_project(session)
-    agent = make_agent(session, project)
+    project, agent = project_agent
     proposal = make_proposal(
         session, agent, project, status=ProposalStatus.APPROVED
     )
 
-    engine = ApprovalEngine()
-    result = engine.approve_proposal(proposal, "reviewer", session)
+    result = approval.approve_proposal(proposal, "reviewer", session)
     assert result is False
 
 
-def test_proposals_needing_human_review(session):
+def test_proposals_needing_human_review(session, approval, project_agent):
     """Only non-auto-approve pending proposals need human review."""
-    project = make_project(session)
-    agent = make_agent(session, project)
+    project, agent = project_agent
     make_proposal(session, agent, project, auto_approve=True, title="Auto one")
-    manual = make_proposal(
+    make_proposal(
         session,
         agent,
         project,
@@ -129,8 +108,7 @@ def test_proposals_needing_human_review(session):
         title="Manual review needed",
     )
 
-    engine = ApprovalEngine()
-    needing = engine.get_proposals_needing_human_review(session)
+    needing = approval.get_proposals_needing_human_review(session)
 
     titles = [p.title for p in needing]
     assert "Manual review needed" in titles
@@ -2,9 +2,12 @@
 
 from unittest.mock import patch, MagicMock
 
+import pytest
+
 from tests.conftest import make_project
 
-from agentloop.models import ProjectStatus
+from agentloop.engine.worker import WorkerEngine
+from agentloop.models import ProjectContext, ProjectStatus
 
 
 # ─── Project status filtering ───
@@ -52,11 +55,12 @@ def test_filter_by_status(client, session):
 def test_create_context_entry(client, session):
     """POST /api/v1/context creates a context entry."""
     proj = make_project(session, slug="ctx-proj")
+    pid = str(proj.id)
 
     r = client.post(
         "/api/v1/context",
         json={
-            "project_id": str(proj.id),
+            "project_id": pid,
             "category": "architecture",
             "key": "db_choice",
             "content": "Using PostgreSQL with SQLAlchemy",
@@ -71,12 +75,13 @@ def test_create_context_entry(client, session):
 def test_upsert_context_entry(client, session):
     """POST /api/v1/context upserts on same project+category+key."""
     proj = make_project(session, slug="upsert-proj")
+    pid = str(proj.id)
 
     # Create
     r1 = client.post(
         "/api/v1/context",
         json={
-            "project_id": str(proj.id),
+            "project_id": pid,
             "category": "decisions",
             "key": "auth",
             "content": "JWT tokens",
@@ -89,7 +94,7 @@ def test_upsert_context_entry(client, session):
     r2 = client.post(
         "/api/v1/context",
         json={
-            "project_id": str(proj.id),
+            "project_id": pid,
             "category": "decisions",
             "key": "auth",
             "content": "Switched to session cookies",
@@ -100,30 +105,28 @@ def test_upsert_context_entry(client, session):
     assert r2.json()["content"] == "Switched to session cookies"
 
 
+def _seed_context(session, proj, entries):
+    """Insert ProjectContext rows directly, bypassing the API."""
+    rows = [ProjectContext(project_id=proj.id, **e) for e in entries]
+    session.add_all(rows)
+    session.commit()
+    return rows
+
+
 def test_list_context_entries(client, session):
     """GET /api/v1/context/{project_id} lists entries."""
     proj = make_project(session, slug="list-ctx")
-
-    client.post(
-        "/api/v1/context",
-        json={
-            "project_id": str(proj.id),
-            "category": "patterns",
-            "key": "api_style",
-            "content": "RESTful with JSON",
-        },
-    )
-    client.post(
-        "/api/v1/context",
-        json={
-            "project_id": str(proj.id),
+    pid = str(proj.id)
+    _seed_context(session, proj, [
+        {"category": "patterns", "key": "api_style", "content": "RESTful with JSON"},
+        {
             "category": "bugs",
             "key": "mem_leak",
             "content": "Fixed memory leak in worker",
         },
-    )
+    ])
 
-    r = client.get(f"/api/v1/context/{proj.id}")
+    r = client.get(f"/api/v1/context/{pid}")
     assert r.status_code == 200
     assert len(r.json()) == 2
 
@@ -131,17 +134,13 @@ def test_list_context_entries(client, session):
 def test_list_context_by_category(client, session):
     """GET /api/v1/context/{id}?category=bugs filters."""
     proj = make_project(session, slug="cat-ctx")
+    pid = str(proj.id)
+    _seed_context(session, proj, [
+        {"category": "bugs", "key": "b1", "content": "bug 1"},
+        {"category": "notes", "key": "n1", "content": "note 1"},
+    ])
 
-    client.post(
-        "/api/v1/context",
-        json={"project_id": str(proj.id), "category": "bugs", "key": "b1", "content": "bug 1"},
-    )
-    client.post(
-        "/api/v1/context",
-        json={"project_id": str(proj.id), "category": "notes", "key": "n1", "content": "note 1"},
-    )
-
-    r = client.get(f"/api/v1/context/{proj.id}?category=bugs")
+    r = client.get(f"/api/v1/context/{pid}?category=bugs")
     assert r.status_code == 200
     assert len(r.json()) == 1
     assert r.json()[0]["key"] == "b1"
@@ -150,49 +149,40 @@ def test_list_context_by_category(client, session):
 def test_delete_context_entry(client, session):
     """DELETE /api/v1/context/{entry_id} removes an entry."""
     proj = make_project(session, slug="del-ctx")
+    pid = str(proj.id)
+    (entry,) = _seed_context(session, proj, [
+        {"category": "notes", "key": "tmp", "content": "temp"},
+    ])
 
-    r1 = client.post(
-        "/api/v1/context",
-        json={"project_id": str(proj.id), "category": "notes", "key": "tmp", "content": "temp"},
-    )
-    entry_id = r1.json()["id"]
-
-    r2 = client.delete(f"/api/v1/context/{entry_id}")
+    r2 = client.delete(f"/api/v1/context/{entry.id}")
     assert r2.status_code == 204
 
-    r3 = client.get(f"/api/v1/context/{proj.id}")
+    r3 = client.get(f"/api/v1/context/{pid}")
     assert len(r3.json()) == 0
 
 
 # ─── Chat API ───
 
 
-def _install_mock_chat_dispatcher():
-    """Install a mock ChatDispatcher on WorkerEngine and return it."""
-    from agentloop.engine.worker import WorkerEngine
-
+@pytest.fixture
+def chat_dispatcher(monkeypatch):
+    """Install a mock ChatDispatcher on WorkerEngine for one test."""
     mock_dispatcher = MagicMock()
     mock_dispatcher.available = True
     mock_dispatcher.send.return_value = {"status": "ok"}
     mock_dispatcher.extract_text.return_value = "Hello from agent!"
-    WorkerEngine._chat_dispatcher = mock_dispatcher
+    monkeypatch.setattr(WorkerEngine, "_chat_dispatcher", mock_dispatcher)
     return mock_dispatcher
 
 
-def _clear_chat_dispatcher():
-    from agentloop.engine.worker import WorkerEngine
-    WorkerEngine._chat_dispatcher = None
-
-
-def test_chat_send_message(client, session):
+def test_chat_send_message(client, session, chat_dispatcher):
     """POST /api/v1/chat sends message and returns response."""
-    mock_disp = _install_mock_chat_dispatcher()
-
     proj = make_project(session, slug="chat-proj")
+    pid = str(proj.id)
 
     r = client.post(
         "/api/v1/chat/",
-        json={"content": "Hello", "project_id": str(proj.id)},
+        json={"content": "Hello", "project_id": pid},
     )
     assert r.status_code == 200
     data = r.json()
@@ -200,21 +190,18 @@ def test_chat_send_message(client, session):
     assert data["assistant_message"]["content"] == "Hello from agent!"
     assert data["session_id"]
 
-    _clear_chat_dispatcher()
 
-
-def test_chat_gateway_unavailable(client):
+def test_chat_gateway_unavailable(client, monkeypatch):
     """POST /api/v1/chat returns 503 when no chat dispatcher configured."""
-    _clear_chat_dispatcher()
+    monkeypatch.setattr(WorkerEngine, "_chat_dispatcher", None)
 
     r = client.post("/api/v1/chat/", json={"content": "Hello"})
     assert r.status_code == 503
 
 
-def test_chat_history(client, session):
+def test_chat_history(client, session, chat_dispatcher):
     """GET /api/v1/chat/history/{session_id} returns messages."""
-    mock_disp = _install_mock_chat_dispatcher()
-    mock_disp.extract_text.return_value = "Reply"
+    chat_dispatcher.extract_text.return_value = "Reply"
 
     r = client.post("/api/v1/chat/", json={"content": "First message"})
     sid = r.json()["session_id"]
@@ -225,13 +212,10 @@ def test_chat_history(client, session):
     assert r2.json()[0]["role"] == "user"
     assert r2.json()[1]["role"] == "assistant"
 
-    _clear_chat_dispatcher()
-
 
-def test_chat_sessions_list(client, session):
+def test_chat_sessions_list(client, session, chat_dispatcher):
     """GET /api/v1/chat/sessions lists active sessions."""
-    mock_disp = _install_mock_chat_dispatcher()
-    mock_disp.extract_text.return_value = "ok"
+    chat_dispatcher.extract_text.return_value = "ok"
 
     client.post("/api/v1/chat/", json={"content": "msg1"})
 
@@ -239,5 +223,3 @@ def test_chat_sessions_list(client, session):
     assert r.status_code == 200
     assert len(r.json()) >= 1
     assert r.json()[0]["message_count"] == 2
-
-    _clear_chat_dispatcher()
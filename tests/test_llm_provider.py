@@ -0,0 +1,210 @@
+"""Tests for the llm plugin's provider: rate limiting and fan-out."""
+
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from agentloop.config import settings
+
+
+@pytest.fixture
+def fake_clock(llm_provider_module, monkeypatch):
+    """Replace the provider's clock; sleep() advances it and is recorded."""
+    clock = SimpleNamespace(now=1000.0, sleeps=[])
+
+    def _sleep(seconds):
+        clock.sleeps.append(seconds)
+        clock.now += seconds
+
+    monkeypatch.setattr(
+        llm_provider_module,
+        "time",
+        SimpleNamespace(monotonic=lambda: clock.now, sleep=_sleep),
+    )
+    return clock
+
+
+@pytest.fixture
+def make_provider(llm_provider_module):
+    """Build LLMProviders pointed at an address nothing listens on."""
+
+    def _make(**kwargs):
+        return llm_provider_module.LLMProvider(
+            base_url="http://llm-test:9999/v1", **kwargs
+        )
+
+    return _make
+
+
+# ─── Token bucket ───
+
+
+def test_bucket_allows_burst_up_to_capacity(llm_provider_module, fake_clock):
+    """A full bucket hands out `capacity` tokens without sleeping."""
+    bucket = llm_provider_module._TokenBucket(rate=1, capacity=3)
+
+    for _ in range(3):
+        bucket.acquire()
+
+    assert fake_clock.sleeps == []
+
+
+def test_bucket_refills_over_time(llm_provider_module, fake_clock):
+    """Elapsed time adds rate * seconds tokens, capped at capacity."""
+    bucket = llm_provider_module._TokenBucket(rate=2, capacity=2)
+    bucket.acquire()
+    bucket.acquire()
+
+    fake_clock.now += 1.0  # two tokens' worth
+    bucket.acquire()
+    bucket.acquire()
+    assert fake_clock.sleeps == []
+
+    fake_clock.now += 60.0  # refill never exceeds capacity
+    bucket.acquire()
+    bucket.acquire()
+    assert fake_clock.sleeps == []
+    bucket.acquire()
+    assert fake_clock.sleeps == [pytest.approx(0.5)]
+
+
+def test_bucket_blocks_when_empty(llm_provider_module, fake_clock):
+    """An empty bucket sleeps just long enough for one token to refill."""
+    bucket = llm_provider_module._TokenBucket(rate=4, capacity=1)
+    bucket.acquire()
+
+    bucket.acquire()
+
+    assert fake_clock.sleeps == [pytest.approx(0.25)]
+
+
+def test_zero_rpm_disables_limiter(make_provider, monkeypatch):
+    """llm_rpm=0 means no bucket; a positive value sizes it per minute."""
+    monkeypatch.setattr(settings, "llm_rpm", 0)
+    assert make_provider()._bucket is None
+
+    monkeypatch.setattr(settings, "llm_rpm", 120)
+    bucket = make_provider()._bucket
+    assert bucket.rate == 2
+    assert bucket.capacity == 120
+
+
+# ─── Warmup ───
+
+
+def test_warmup_is_explicit(llm_provider_module, make_provider, monkeypatch):
+    """Building a provider sends nothing; warmup() requests in the background."""
+    called = threading.Event()
+    threads = []
+
+    def _warmup(self):
+        threads.append(threading.current_thread())
+        called.set()
+
+    monkeypatch.setattr(llm_provider_module.LLMProvider, "_warmup", _warmup)
+    provider = make_provider()
+    assert not called.wait(timeout=0.05)
+
+    provider.warmup()
+
+    assert called.wait(timeout=5)
+    assert threads[0] is not threading.current_thread()
+
+
+# ─── chat ───
+
+
+def test_chat_does_not_stream(make_provider, monkeypatch):
+    """chat() makes one non-streaming request, for backends without streaming."""
+    monkeypatch.setattr(settings, "llm_rpm", 0)
+    provider = make_provider()
+    requests = []
+
+    def _create(**kwargs):
+        requests.append(kwargs)
+        message = SimpleNamespace(content="hello")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    completions = SimpleNamespace(create=_create)
+    monkeypatch.setattr(
+        provider,
+        "_client",
+        SimpleNamespace(chat=SimpleNamespace(completions=completions)),
+    )
+
+    assert provider.chat("hi", system="be brief") == "hello"
+    assert len(requests) == 1
+    assert "stream" not in requests[0]
+    assert requests[0]["messages"] == [
+        {"role": "system", "content": "be brief"},
+        {"role": "user", "content": "hi"},
+    ]
+
+
+def test_provider_keeps_sdk_read_timeout(make_provider):
+    """The pooled transport keeps the SDK's 600s default, not the step timeout."""
+    timeout = make_provider()._http.timeout
+    assert timeout.read == 600
+    assert timeout.connect == 5
+
+
+# ─── chat_many ───
+
+
+def test_chat_many_empty_input(make_provider, monkeypatch):
+    """No prompts means no requests and an empty result."""
+    provider = make_provider()
+    calls = []
+    monkeypatch.setattr(provider, "chat", lambda prompt, **kw: calls.append(prompt))
+
+    assert provider.chat_many([]) == []
+    assert calls == []
+
+
+def test_chat_many_preserves_order(make_provider, monkeypatch):
+    """Results follow the input order even when later prompts finish first."""
+    provider = make_provider()
+    prompts = [f"p{i}" for i in range(6)]
+    # Each prompt waits until every later one has finished, so completion
+    # order is the reverse of submission order
+    done = {p: threading.Event() for p in prompts}
+    finished = []
+
+    def _chat(prompt, **kwargs):
+        for later in prompts[prompts.index(prompt) + 1:]:
+            assert done[later].wait(timeout=5)
+        finished.append(prompt)
+        done[prompt].set()
+        return prompt.upper()
+
+    monkeypatch.setattr(provider, "chat", _chat)
+
+    assert provider.chat_many(prompts, concurrency=len(prompts)) == [
+        p.upper() for p in prompts
+    ]
+    assert finished == prompts[::-1]
+
+
+def test_chat_many_caps_concurrency(make_provider, monkeypatch):
+    """No more than `concurrency` chats run at the same time."""
+    provider = make_provider()
+    lock = threading.Lock()
+    in_flight = SimpleNamespace(now=0, peak=0)
+
+    def _chat(prompt, **kwargs):
+        with lock:
+            in_flight.now += 1
+            in_flight.peak = max(in_flight.peak, in_flight.now)
+        time.sleep(0.01)
+        with lock:
+            in_flight.now -= 1
+        return prompt
+
+    monkeypatch.setattr(provider, "chat", _chat)
+
+    assert provider.chat_many([str(i) for i in range(8)], concurrency=2) == [
+        str(i) for i in range(8)
+    ]
+    assert in_flight.peak == 2
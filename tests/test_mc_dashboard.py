@@ -0,0 +1,187 @@
+"""Tests for the mission-control plugin's dashboard routes."""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from agentloop.config import settings
+from agentloop.database import get_session
+from agentloop.integrations import mission_control
+from agentloop.models import MissionStatus
+from tests.conftest import (
+    _savepoint_session,
+    make_agent,
+    make_mission,
+    make_project,
+    make_proposal,
+)
+
+
+@pytest.fixture
+def mc_client(mc_dashboard_module, connection):
+    """TestClient for an app serving only the dashboard router."""
+    app = FastAPI()
+    app.include_router(mc_dashboard_module.router)
+
+    def _override_session():
+        with _savepoint_session(connection) as session:
+            yield session
+
+    app.dependency_overrides[get_session] = _override_session
+    with TestClient(app) as c:
+        yield c
+
+
+class _AsyncMC:
+    """Stands in for the shared httpx.AsyncClient; serves canned MC paths.
+
+    A path mapped to an exception raises it, like a failed request would.
+    """
+
+    def __init__(self, routes):
+        self.routes = routes
+
+    async def get(self, url, **kwargs):
+        body = self.routes[url.removeprefix(settings.mc_base_url)]
+        if isinstance(body, Exception):
+            raise body
+        return SimpleNamespace(raise_for_status=lambda: None, json=lambda: body)
+
+
+@pytest.fixture
+def mc_async(monkeypatch):
+    """Route async MC GETs to an ``_AsyncMC`` over the returned dict."""
+    routes = {}
+    monkeypatch.setattr(mission_control, "_async_client", lambda: _AsyncMC(routes))
+    return routes
+
+
+# ─── Board proxy ───
+
+
+def test_boards_counts_tasks_per_board(mc_client, mc_async):
+    """Each board carries its own task_count and status_counts."""
+    mc_async["/api/v1/boards"] = {
+        "items": [{"id": "b1", "name": "One"}, {"id": "b2", "name": "Two"}]
+    }
+    mc_async["/api/v1/boards/b1/tasks"] = {
+        "items": [{"status": "inbox"}, {"status": "inbox"}, {"status": "done"}]
+    }
+    mc_async["/api/v1/boards/b2/tasks"] = {"items": [{}]}
+
+    r = mc_client.get("/api/v1/mc/boards")
+
+    assert r.status_code == 200
+    boards = {b["id"]: b for b in r.json()["boards"]}
+    assert boards["b1"]["name"] == "One"
+    assert boards["b1"]["task_count"] == 3
+    assert boards["b1"]["status_counts"] == {"inbox": 2, "done": 1}
+    assert boards["b2"]["task_count"] == 1
+    assert boards["b2"]["status_counts"] == {"unknown": 1}
+
+
+def test_failing_board_falls_back_to_no_tasks(mc_client, mc_async):
+    """A board whose task fetch fails is listed with no tasks."""
+    mc_async["/api/v1/boards"] = {"items": [{"id": "b1"}, {"id": "b2"}]}
+    mc_async["/api/v1/boards/b1/tasks"] = RuntimeError("MC unreachable")
+    mc_async["/api/v1/boards/b2/tasks"] = {"items": [{"status": "inbox"}]}
+
+    r = mc_client.get("/api/v1/mc/boards")
+    boards = {b["id"]: b for b in r.json()["boards"]}
+    assert boards["b1"]["task_count"] == 0
+    assert boards["b1"]["status_counts"] == {}
+    assert boards["b2"]["task_count"] == 1
+
+    r = mc_client.get("/api/v1/mc/boards/b1/tasks")
+    assert r.json() == {"board_id": "b1", "tasks": [], "total": 0}
+
+
+def test_async_client_is_shared_until_closed(monkeypatch):
+    """The async client is created lazily, reused, and recreated after close."""
+    monkeypatch.setattr(mission_control, "_async_http", None)
+
+    async def _scenario():
+        first = mission_control._async_client()
+        assert mission_control._async_client() is first
+        await mission_control.aclose_http()
+        assert first.is_closed
+        assert mission_control._async_http is None
+        second = mission_control._async_client()
+        assert second is not first
+        await mission_control.aclose_http()
+
+    asyncio.run(_scenario())
+
+
+# ─── Sync ───
+
+
+def test_sync_reports_each_completed_mission_once(
+    mc_client, mc_dashboard_module, session, monkeypatch
+):
+    """Completed MC missions get one comment and one move to review each."""
+    calls = []
+    monkeypatch.setattr(
+        mc_dashboard_module, "BOARD_PROJECT_MAP", {"board-1": "test-project"}
+    )
+    monkeypatch.setattr(mc_dashboard_module, "sync_tasks_for_project", lambda b: [])
+    monkeypatch.setattr(
+        mc_dashboard_module,
+        "report_agent_activity",
+        lambda *args: calls.append(("activity", *args)),
+    )
+    monkeypatch.setattr(
+        mc_dashboard_module,
+        "update_task_status",
+        lambda *args: calls.append(("status", *args)),
+    )
+
+    project = make_project(session, commit=False)
+    agent = make_agent(session, project, commit=False, name="Coder")
+    for task_id, status, assignee in (
+        ("t-assigned", MissionStatus.COMPLETED, agent),
+        ("t-unassigned", MissionStatus.COMPLETED, None),
+        ("t-active", MissionStatus.ACTIVE, agent),
+    ):
+        proposal = make_proposal(
+            session,
+            agent,
+            project,
+            commit=False,
+            mc_task_id=task_id,
+            mc_board_id="board-1",
+        )
+        make_mission(
+            session,
+            proposal,
+            project,
+            assignee,
+            commit=False,
+            title=f"Mission {task_id}",
+            status=status,
+        )
+    session.commit()
+
+    r = mc_client.post("/api/v1/mc/sync")
+
+    assert r.status_code == 200
+    reported = {row["mc_task_id"]: row["agent"] for row in r.json()["reported"]}
+    assert reported == {"t-assigned": "Coder", "t-unassigned": "AgentLoop"}
+    activity = sorted(c[1:] for c in calls if c[0] == "activity")
+    status = sorted(c[1:] for c in calls if c[0] == "status")
+    assert activity == [
+        ("board-1", "t-assigned", "Coder", "Mission completed: Mission t-assigned"),
+        (
+            "board-1",
+            "t-unassigned",
+            "AgentLoop",
+            "Mission completed: Mission t-unassigned",
+        ),
+    ]
+    assert status == [
+        ("board-1", "t-assigned", "review"),
+        ("board-1", "t-unassigned", "review"),
+    ]
@@ -0,0 +1,114 @@
+"""Tests for MC SSE event buffering and SSE-triggered sync debouncing."""
+
+import asyncio
+import threading
+
+import pytest
+
+from agentloop.integrations.mc_streams import (
+    _EVENT_QUEUE_SIZE,
+    _drain_events,
+    _enqueue_event,
+)
+
+
+# ─── Event queue ───
+
+
+def test_enqueue_drops_oldest_when_full():
+    """A full queue evicts its oldest event to make room for the newest."""
+    queue = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+    for i in range(_EVENT_QUEUE_SIZE + 1):
+        _enqueue_event(queue, ("task.updated", {"n": i}), "test")
+
+    assert queue.qsize() == _EVENT_QUEUE_SIZE
+    assert queue.get_nowait() == ("task.updated", {"n": 1})
+
+
+def test_drain_survives_handler_errors():
+    """A failing handler is logged and the next event is still delivered."""
+    seen = []
+
+    def _handler(event_type, payload):
+        seen.append(payload["n"])
+        if payload["n"] == 0:
+            raise RuntimeError("boom")
+
+    async def _scenario():
+        queue = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+        for i in range(3):
+            _enqueue_event(queue, ("task.created", {"n": i}), "test")
+        consumer = asyncio.create_task(_drain_events(queue, _handler, "test"))
+        await queue.join()
+        consumer.cancel()
+
+    asyncio.run(_scenario())
+    assert seen == [0, 1, 2]
+
+
+def test_drain_runs_handler_off_loop():
+    """A blocked handler doesn't stall the loop; events queue up behind it."""
+    release = threading.Event()
+    seen = []
+
+    def _handler(event_type, payload):
+        assert release.wait(timeout=5)
+        seen.append(payload["n"])
+
+    async def _scenario():
+        queue = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
+        consumer = asyncio.create_task(_drain_events(queue, _handler, "test"))
+        for i in range(3):
+            _enqueue_event(queue, ("task.created", {"n": i}), "test")
+            await asyncio.sleep(0.01)
+        # The first handler is still blocked, yet the loop kept enqueueing
+        assert seen == []
+        assert queue.qsize() == 2
+        release.set()
+        await queue.join()
+        consumer.cancel()
+
+    asyncio.run(_scenario())
+    assert seen == [0, 1, 2]
+
+
+# ─── Sync debounce ───
+
+
+@pytest.fixture
+def debounce(mc_hooks_module, monkeypatch):
+    """Fresh debounce state with a short window and a recording sync."""
+    calls = []
+    monkeypatch.setattr(mc_hooks_module, "_last_sync", {})
+    monkeypatch.setattr(mc_hooks_module, "_pending_sync", {})
+    monkeypatch.setattr(mc_hooks_module, "_SYNC_DEBOUNCE_SECONDS", 0.05)
+    monkeypatch.setattr(
+        mc_hooks_module, "on_tick_sync", lambda **kw: calls.append(kw["session"])
+    )
+    return calls
+
+
+def test_debounce_syncs_on_leading_edge(mc_hooks_module, debounce):
+    """The first event for a board syncs immediately."""
+    mc_hooks_module._sync_board("board-1")
+    assert len(debounce) == 1
+
+
+def test_debounce_coalesces_burst_into_trailing_sync(mc_hooks_module, debounce):
+    """Events inside the window collapse into one sync when it closes."""
+
+    for _ in range(5):
+        mc_hooks_module._sync_board("board-1")
+    assert len(debounce) == 1
+    timer = mc_hooks_module._pending_sync["board-1"]
+
+    timer.join(timeout=1)
+    assert len(debounce) == 2
+    assert mc_hooks_module._pending_sync == {}
+
+
+def test_debounce_is_per_board(mc_hooks_module, debounce):
+    """A burst on one board doesn't hold back another board's sync."""
+    mc_hooks_module._sync_board("board-1")
+    mc_hooks_module._sync_board("board-2")
+    assert len(debounce) == 2
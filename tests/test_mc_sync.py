@@ -1,9 +1,12 @@
 """Tests for Mission Control sync and integration."""
 
-from unittest.mock import patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
-import httpx
+import pytest
+from sqlmodel import select
 
+from agentloop.integrations import mission_control
 from agentloop.integrations.mission_control import (
     get_boards,
     get_board_tasks,
@@ -14,74 +17,104 @@ from agentloop.integrations.mission_control import (
     ask_user,
     sync_tasks_for_project,
 )
+from agentloop.models import AgentStatus, ProjectStatus, Proposal
+from tests.conftest import make_agent, make_project, make_proposal
+
+
+class _HTTPStatusError(Exception):
+    """Stands in for httpx.HTTPStatusError; the wrappers catch any Exception."""
 
 
 def _mock_response(json_data, status_code=200):
-    """Create a mock httpx.Response."""
-    resp = MagicMock(spec=httpx.Response)
-    resp.status_code = status_code
-    resp.json.return_value = json_data
-    resp.raise_for_status = MagicMock()
-    if status_code >= 400:
-        resp.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "error", request=MagicMock(), response=resp
-        )
-    return resp
+    """Create a lightweight stand-in for an httpx.Response."""
+
+    def _raise_for_status():
+        if status_code >= 400:
+            raise _HTTPStatusError(f"HTTP {status_code}")
+
+    return SimpleNamespace(
+        status_code=status_code,
+        json=lambda: json_data,
+        raise_for_status=_raise_for_status,
+    )
+
+
+@pytest.fixture
+def mc_http(monkeypatch):
+    """Swap the shared MC HTTP client for a stub that records requests.
+
+    Set ``response`` (or ``error``) on the returned stub before calling the
+    code under test; ``calls`` collects ``(method, url, kwargs)`` tuples.
+    """
+    stub = SimpleNamespace(calls=[], response=_mock_response({}), error=None)
+
+    def _method(name):
+        def _request(url, **kwargs):
+            stub.calls.append((name, url, kwargs))
+            if stub.error is not None:
+                raise stub.error
+            return stub.response
+        return _request
+
+    stub.get, stub.post, stub.patch = _method("get"), _method("post"), _method("patch")
+    monkeypatch.setattr(mission_control, "_http", stub)
+    return stub
 
 
 # ─── MC API wrappers ───
 
 
-@patch("agentloop.integrations.mission_control.httpx.get")
-def test_get_boards(mock_get):
+def test_get_boards(mc_http):
     """get_boards should parse items from response."""
-    mock_get.return_value = _mock_response({"items": [{"id": "b1", "name": "Board"}]})
+    mc_http.response = _mock_response({"items": [{"id": "b1", "name": "Board"}]})
     boards = get_boards()
     assert len(boards) == 1
     assert boards[0]["id"] == "b1"
 
 
-@patch("agentloop.integrations.mission_control.httpx.get")
-def test_get_boards_failure_returns_empty(mock_get):
+def test_get_boards_failure_returns_empty(mc_http):
     """get_boards should return [] on failure."""
-    mock_get.side_effect = Exception("connection refused")
+    mc_http.error = Exception("connection refused")
     boards = get_boards()
     assert boards == []
 
 
-@patch("agentloop.integrations.mission_control.httpx.get")
-def test_get_board_tasks(mock_get):
+def test_get_boards_http_error_returns_empty(mc_http):
+    """get_boards should return [] when MC answers with an error status."""
+    mc_http.response = _mock_response({}, status_code=500)
+    assert get_boards() == []
+
+
+def test_get_board_tasks(mc_http):
     """get_board_tasks should return task list."""
-    mock_get.return_value = _mock_response(
-        {"items": [{"id": "t1", "status": "inbox"}]}
-    )
+    mc_http.response = _mock_response({"items": [{"id": "t1", "status": "inbox"}]})
     tasks = get_board_tasks("board-1")
     assert len(tasks) == 1
 
 
-@patch("agentloop.integrations.mission_control.httpx.get")
-def test_get_board_tasks_with_status_filter(mock_get):
+def test_get_board_tasks_with_status_filter(mc_http):
     """get_board_tasks should pass status as query param."""
-    mock_get.return_value = _mock_response({"items": []})
+    mc_http.response = _mock_response({"items": []})
     get_board_tasks("board-1", status="inbox")
-    url = mock_get.call_args[0][0]
+    method, url, _ = mc_http.calls[0]
+    assert method == "get"
     assert "?status=inbox" in url
 
 
-@patch("agentloop.integrations.mission_control.httpx.patch")
-def test_update_task_status(mock_patch):
+def test_update_task_status(mc_http):
     """update_task_status should PATCH the task."""
-    mock_patch.return_value = _mock_response({"id": "t1", "status": "done"})
+    mc_http.response = _mock_response({"id": "t1", "status": "done"})
     result = update_task_status("b1", "t1", "done", "Completed by agent")
+    assert mc_http.calls[0][0] == "patch"
     assert result is not None
     assert result["status"] == "done"
 
 
-@patch("agentloop.integrations.mission_control.httpx.post")
-def test_create_task(mock_post):
+def test_create_task(mc_http):
     """create_task should POST to the board."""
-    mock_post.return_value = _mock_response({"id": "t-new", "title": "New task"})
+    mc_http.response = _mock_response({"id": "t-new", "title": "New task"})
     result = create_task("b1", "New task", "desc", "high")
+    assert mc_http.calls[0][0] == "post"
     assert result["id"] == "t-new"
 
 
@@ -139,16 +172,142 @@ def test_ask_user_without_correlation(mock_post):
 # ─── Sync logic ───
 
 
+# One task per MC status; only inbox/in_progress should be synced
+_SYNC_FIXTURE_TASKS = (
+    {"id": "t1", "status": "inbox"},
+    {"id": "t2", "status": "in_progress"},
+    {"id": "t3", "status": "done"},
+    {"id": "t4", "status": "review"},
+)
+
+
+@pytest.mark.parametrize(
+    "tasks,expected_ids",
+    [
+        (_SYNC_FIXTURE_TASKS, {"t1", "t2"}),
+        (_SYNC_FIXTURE_TASKS[2:], set()),
+        ((), set()),
+    ],
+    ids=["mixed", "nothing_open", "empty_board"],
+)
 @patch("agentloop.integrations.mission_control.get_board_tasks")
-def test_sync_tasks_for_project(mock_tasks):
+def test_sync_tasks_for_project(mock_tasks, tasks, expected_ids):
     """sync_tasks_for_project should return inbox/in_progress tasks only."""
-    mock_tasks.return_value = [
-        {"id": "t1", "status": "inbox"},
-        {"id": "t2", "status": "in_progress"},
-        {"id": "t3", "status": "done"},
-        {"id": "t4", "status": "review"},
-    ]
+    mock_tasks.return_value = list(tasks)
     result = sync_tasks_for_project("board-1")
-    assert len(result) == 2
-    ids = {t["id"] for t in result}
-    assert ids == {"t1", "t2"}
+    assert {t["id"] for t in result} == expected_ids
+
+
+# ─── Inbound tick sync ───
+
+
+@pytest.fixture
+def mc_boards(mc_hooks_module, monkeypatch):
+    """Map board-a/board-b to proj-a/proj-b and stub their open tasks.
+
+    Set ``tasks[board_id]`` to a list of tasks, or to an exception to make
+    that board's fetch fail.
+    """
+    tasks = {"board-a": [], "board-b": []}
+
+    def _sync_tasks(board_id):
+        if isinstance(tasks[board_id], Exception):
+            raise tasks[board_id]
+        return tasks[board_id]
+
+    monkeypatch.setattr(
+        mc_hooks_module,
+        "BOARD_PROJECT_MAP",
+        {"board-a": "proj-a", "board-b": "proj-b"},
+    )
+    monkeypatch.setattr(mc_hooks_module, "sync_tasks_for_project", _sync_tasks)
+    return tasks
+
+
+def _make_board_project(session, slug, agent_status=AgentStatus.ACTIVE, **overrides):
+    """A project for ``slug`` with one agent, left uncommitted."""
+    project = make_project(session, commit=False, slug=slug, name=slug, **overrides)
+    make_agent(
+        session, project, commit=False, name=f"{slug}-agent", status=agent_status
+    )
+    return project
+
+
+def _synced_proposals(session):
+    """mc_task_id → Proposal for every proposal synced from MC."""
+    return {
+        p.mc_task_id: p
+        for p in session.exec(select(Proposal).where(Proposal.mc_task_id.is_not(None)))
+    }
+
+
+def test_on_tick_sync_creates_new_tasks_once(session, mc_hooks_module, mc_boards):
+    """Known tasks are skipped and a task repeated in one payload is created once."""
+    project = _make_board_project(session, "proj-a")
+    _make_board_project(session, "proj-b")
+    session.commit()
+    agent = project.agents[0]
+    make_proposal(session, agent, project, mc_task_id="t1", mc_board_id="board-a")
+    mc_boards["board-a"] = [
+        {"id": "t1"}, {"id": "t2"}, {"id": "t2"}, {"title": "no id"},
+    ]
+
+    mc_hooks_module.on_tick_sync(session=session)
+
+    synced = _synced_proposals(session)
+    assert sorted(synced) == ["t1", "t2"]
+    assert synced["t1"].title == "Fix login bug"
+    assert synced["t2"].project_id == project.id
+    assert synced["t2"].agent_id == agent.id
+    assert synced["t2"].mc_board_id == "board-a"
+
+
+@pytest.mark.parametrize(
+    "project_overrides,agent_status",
+    [
+        ({"status": ProjectStatus.DECOMMISSIONED}, AgentStatus.ACTIVE),
+        ({}, AgentStatus.PAUSED),
+    ],
+    ids=["decommissioned_project", "no_active_agent"],
+)
+def test_on_tick_sync_skips_unusable_boards(
+    session, mc_hooks_module, mc_boards, project_overrides, agent_status
+):
+    """Boards without a live project and active agent are left alone."""
+    _make_board_project(session, "proj-a", agent_status, **project_overrides)
+    _make_board_project(session, "proj-b")
+    session.commit()
+    mc_boards["board-a"] = [{"id": "a1"}]
+    mc_boards["board-b"] = [{"id": "b1"}]
+
+    mc_hooks_module.on_tick_sync(session=session)
+
+    assert sorted(_synced_proposals(session)) == ["b1"]
+
+
+def test_on_tick_sync_board_failure_is_isolated(
+    session, mc_hooks_module, mc_boards, caplog
+):
+    """A board whose fetch fails doesn't stop the others from syncing."""
+    _make_board_project(session, "proj-a")
+    _make_board_project(session, "proj-b")
+    session.commit()
+    mc_boards["board-a"] = RuntimeError("MC unreachable")
+    mc_boards["board-b"] = [{"id": "b1"}]
+
+    mc_hooks_module.on_tick_sync(session=session)
+
+    assert sorted(_synced_proposals(session)) == ["b1"]
+    assert "MC sync for board board-a failed" in caplog.text
+
+
+def test_on_tick_sync_preload_failure_is_logged(mc_hooks_module, monkeypatch, caplog):
+    """A failing project/agent preload is logged, not raised into the tick."""
+    monkeypatch.setattr(mc_hooks_module, "BOARD_PROJECT_MAP", {"board-1": "proj"})
+
+    def _exec(*args, **kwargs):
+        raise RuntimeError("db down")
+
+    mc_hooks_module.on_tick_sync(session=SimpleNamespace(exec=_exec))
+
+    assert "MC sync preload failed" in caplog.text
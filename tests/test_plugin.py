@@ -0,0 +1,91 @@
+"""Tests for the PluginManager's hook dispatch."""
+
+import sys
+import textwrap
+
+import pytest
+
+from agentloop.plugin import PluginManager
+
+
+def _write_plugin(plugins_dir, name, hooks_source, depends_on=()):
+    """Lay out a minimal plugin with a single ``hooks`` module."""
+    plugin_dir = plugins_dir / name
+    plugin_dir.mkdir()
+    (plugin_dir / "plugin.yaml").write_text(
+        f"name: {name}\nhooks: [hooks]\ndepends_on: {list(depends_on)}\n"
+    )
+    (plugin_dir / "hooks.py").write_text(textwrap.dedent(hooks_source))
+
+
+@pytest.fixture
+def plugins_dir(tmp_path, monkeypatch):
+    """A plugins directory with two plugins sharing an ``on_ping`` hook."""
+    # Loading prepends each plugin dir to sys.path; don't leak them
+    monkeypatch.setattr(sys, "path", list(sys.path))
+    _write_plugin(
+        tmp_path,
+        "pm-test-alpha",
+        """
+        def on_ping(**kwargs):
+            return ("alpha", kwargs["n"])
+
+        def on_boom(**kwargs):
+            raise RuntimeError("boom")
+
+        HOOKS = {"on_ping": on_ping, "on_boom": on_boom}
+        """,
+    )
+    _write_plugin(
+        tmp_path,
+        "pm-test-beta",
+        """
+        def on_ping(**kwargs):
+            return ("beta", kwargs["n"])
+
+        def on_boom(**kwargs):
+            return "survived"
+
+        HOOKS = {"on_ping": on_ping, "on_boom": on_boom}
+        """,
+        depends_on=["pm-test-alpha"],
+    )
+    return tmp_path
+
+
+def test_dispatch_calls_indexed_hooks_in_load_order(plugins_dir):
+    """Every plugin's handler runs, dependencies first, with the kwargs."""
+    pm = PluginManager(plugins_dir=str(plugins_dir))
+    pm.load_all()
+
+    assert pm.dispatch_hook("on_ping", n=7) == [("alpha", 7), ("beta", 7)]
+
+
+def test_dispatch_skips_failing_handler(plugins_dir):
+    """A handler that raises is logged and the rest still run."""
+    pm = PluginManager(plugins_dir=str(plugins_dir))
+    pm.load_all()
+
+    assert pm.dispatch_hook("on_boom") == ["survived"]
+
+
+def test_dispatch_unknown_hook_returns_empty(plugins_dir):
+    """A hook nobody registered yields an empty, falsy sequence."""
+    pm = PluginManager(plugins_dir=str(plugins_dir))
+    assert pm.dispatch_hook("on_ping", n=1) == ()
+
+    pm.load_all()
+    results = pm.dispatch_hook("on_nothing")
+    assert not results
+    assert list(results) == []
+
+
+def test_load_all_reindexes_hooks(plugins_dir):
+    """Plugins loaded by a later load_all() are picked up by dispatch."""
+    pm = PluginManager(plugins_dir=str(plugins_dir), enabled="pm-test-alpha")
+    pm.load_all()
+    assert pm.dispatch_hook("on_ping", n=1) == [("alpha", 1)]
+
+    pm.enabled_filter = None
+    pm.load_all()
+    assert pm.dispatch_hook("on_ping", n=2) == [("alpha", 2), ("beta", 2)]
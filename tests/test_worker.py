@@ -1,136 +1,173 @@
 """Tests for the WorkerEngine."""
 
-from unittest.mock import patch, MagicMock
+from sqlalchemy import event
 
 from agentloop.engine.worker import WorkerEngine
 from agentloop.models import StepStatus, StepType
 from tests.conftest import (
     make_agent,
-    make_mission,
+    make_graph,
     make_project,
-    make_proposal,
     make_step,
 )
 
 
 def test_find_available_steps(session):
     """Worker should find pending steps matching the agent's project."""
-    project = make_project(session)
-    agent = make_agent(session, project)
-    proposal = make_proposal(session, agent, project, status="approved")
-    mission = make_mission(session, proposal, project, agent)
-    step = make_step(session, mission, status=StepStatus.PENDING)
+    graph = make_graph(session, status=StepStatus.PENDING)
 
     worker = WorkerEngine()
-    available = worker._find_available_steps(agent, session)
+    available = worker._find_available_steps(graph.agent, session)
     assert len(available) == 1
-    assert available[0].id == step.id
+    assert available[0].id == graph.step.id
 
 
 def test_no_steps_for_wrong_project(session):
     """Steps in a different project should not be returned."""
-    project1 = make_project(session, slug="proj-1", name="Project 1")
-    project2 = make_project(session, slug="proj-2", name="Project 2")
-    agent1 = make_agent(session, project1, name="agent-1")
-    agent2 = make_agent(session, project2, name="agent-2")
-    proposal = make_proposal(session, agent2, project2, status="approved")
-    mission = make_mission(session, proposal, project2, agent2)
-    make_step(session, mission, status=StepStatus.PENDING)
+    make_graph(session, status=StepStatus.PENDING)
+    other = make_project(session, commit=False, slug="proj-1", name="Project 1")
+    outsider = make_agent(session, other, commit=False, name="agent-1")
+    session.commit()
 
     worker = WorkerEngine()
-    available = worker._find_available_steps(agent1, session)
+    available = worker._find_available_steps(outsider, session)
     assert len(available) == 0
 
 
+def test_find_available_steps_uses_worker_poll_index(session, connection):
+    """The worker poll should search step via ix_step_worker_poll, not scan it."""
+    project = make_project(session)
+    agent = make_agent(session, project, config={"capabilities": ["general_work"]})
+
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if "FROM step" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", _capture)
+    try:
+        WorkerEngine()._find_available_steps(agent, session)
+    finally:
+        event.remove(connection, "before_cursor_execute", _capture)
+
+    statement, parameters = statements[0]
+    plan = connection.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}", parameters
+    ).all()
+    details = [row[-1] for row in plan]
+    assert any("ix_step_worker_poll" in d for d in details), details
+
+
 def test_claimed_step_not_available_to_others(session):
     """A step claimed by one agent should not appear for another."""
-    project = make_project(session)
-    agent1 = make_agent(session, project, name="agent-1")
-    agent2 = make_agent(session, project, name="agent-2")
-    proposal = make_proposal(session, agent1, project, status="approved")
-    mission = make_mission(session, proposal, project, agent1)
+    graph = make_graph(session, with_step=False)
+    agent2 = make_agent(session, graph.project, commit=False, name="agent-2")
     make_step(
         session,
-        mission,
+        graph.mission,
+        commit=False,
         status=StepStatus.CLAIMED,
-        claimed_by_agent_id=agent1.id,
+        claimed_by_agent_id=graph.agent.id,
     )
+    session.commit()
 
     worker = WorkerEngine()
     available = worker._find_available_steps(agent2, session)
     assert len(available) == 0
 
 
+def test_claim_step_loses_race(session):
+    """Claiming a step another agent took after the poll should fail."""
+    graph = make_graph(session, status=StepStatus.PENDING)
+    agent2 = make_agent(session, graph.project, name="agent-2")
+
+    worker = WorkerEngine()
+    assert worker._claim_step(graph.step, agent2, session) is True
+    assert graph.step.status == StepStatus.RUNNING
+    assert worker._claim_step(graph.step, graph.agent, session) is False
+    assert graph.step.claimed_by_agent_id == agent2.id
+
+
 def test_capability_check(session):
     """Agent without the required capability should be excluded."""
-    project = make_project(session)
-    agent = make_agent(
+    graph = make_graph(
         session,
-        project,
-        config={"capabilities": ["run_tests"]},
+        agent_overrides={"config": {"capabilities": ["run_tests"]}},
+        step_type=StepType.DEPLOY,
+        status=StepStatus.PENDING,
     )
-    proposal = make_proposal(session, agent, project, status="approved")
-    mission = make_mission(session, proposal, project, agent)
-    make_step(session, mission, step_type=StepType.DEPLOY, status=StepStatus.PENDING)
 
     worker = WorkerEngine()
-    available = worker._find_available_steps(agent, session)
+    available = worker._find_available_steps(graph.agent, session)
     assert len(available) == 0
 
 
+def test_no_matching_capability_skips_query(session, connection):
+    """An agent with no usable capabilities shouldn't query steps at all."""
+    project = make_project(session)
+    agent = make_agent(session, project, config={"capabilities": ["juggling"]})
+
+    statements = []
+
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", _capture)
+    try:
+        available = WorkerEngine()._find_available_steps(agent, session)
+    finally:
+        event.remove(connection, "before_cursor_execute", _capture)
+
+    assert available == []
+    assert not any("FROM step" in s for s in statements)
+
+
 def test_general_work_capability_matches_all(session):
     """An agent with 'general_work' should handle any step type."""
-    project = make_project(session)
-    agent = make_agent(
+    graph = make_graph(
         session,
-        project,
-        config={"capabilities": ["general_work"]},
+        agent_overrides={"config": {"capabilities": ["general_work"]}},
+        step_type=StepType.DEPLOY,
+        status=StepStatus.PENDING,
     )
-    proposal = make_proposal(session, agent, project, status="approved")
-    mission = make_mission(session, proposal, project, agent)
-    make_step(session, mission, step_type=StepType.DEPLOY, status=StepStatus.PENDING)
 
     worker = WorkerEngine()
-    available = worker._find_available_steps(agent, session)
+    available = worker._find_available_steps(graph.agent, session)
     assert len(available) == 1
 
 
-@patch("agentloop.engine.worker.WorkerEngine._dispatch_to_backend", return_value=False)
-def test_simulate_step_execution_fallback(mock_dispatch, session):
+def test_simulate_step_execution_fallback(session, monkeypatch):
     """When gateway is unavailable, step should be simulated."""
-    project = make_project(session)
-    agent = make_agent(session, project)
-    proposal = make_proposal(session, agent, project, status="approved")
-    mission = make_mission(session, proposal, project, agent)
-    step = make_step(session, mission, status=StepStatus.PENDING)
+    monkeypatch.setattr(
+        WorkerEngine, "_dispatch_to_backend", lambda self, *a, **kw: False
+    )
+    graph = make_graph(session, status=StepStatus.PENDING)
+    step = graph.step
 
     worker = WorkerEngine()
-    result = worker.find_and_execute_work(agent, session)
+    result = worker.find_and_execute_work(graph.agent, session)
 
     assert result is True
-    session.refresh(step)
+    # The worker updated this same instance, so there is nothing to reload
     assert step.status == StepStatus.COMPLETED
     assert step.output is not None
 
 
 def test_generate_work_prompt(session):
     """Work prompt should include mission and step context."""
-    project = make_project(session)
-    agent = make_agent(session, project, name="Coder")
-    proposal = make_proposal(session, agent, project, status="approved")
-    mission = make_mission(
-        session, proposal, project, agent, title="Fix auth", description="Broken login"
-    )
-    step = make_step(
+    graph = make_graph(
         session,
-        mission,
+        agent_overrides={"name": "Coder"},
+        mission_overrides={"title": "Fix auth", "description": "Broken login"},
         title="Write patch",
         description="Patch the auth module",
         step_type=StepType.CODE,
     )
+    agent = graph.agent
 
     worker = WorkerEngine()
-    prompt = worker._generate_work_prompt(step, agent, agent.config, {}, session)
+    prompt = worker._generate_work_prompt(graph.step, agent, agent.config, {}, session)
 
     assert "Coder" in prompt
     assert "Write patch" in prompt